@@ -779,6 +779,10 @@ SHEETS_ENABLE_CACHE = True
 SHEETS_ENABLE_STUDY_TABLE_CACHE = env.bool(
     'SHEETS_ENABLE_STUDY_TABLE_CACHE', True
 )
+# Timeout for study tables in the Django cache (seconds, 0 to disable)
+SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT = env.int(
+    'SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT', 3600
+)
 # iRODS file query limit
 SHEETS_IRODS_LIMIT = env.int('SHEETS_IRODS_LIMIT', 50)
 # Minimum edit config version
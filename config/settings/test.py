@@ -105,6 +105,8 @@ PROJECTROLES_ALLOW_LOCAL_USERS = True
 # Samplesheets app settings
 SHEETS_ENABLE_CACHE = False  # Temporarily disabled to fix CI, see issue #556
 SHEETS_ENABLE_STUDY_TABLE_CACHE = True
+# Disabled as the Django cache is not rolled back between tests
+SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT = 0
 SHEETS_EXTERNAL_LINK_PATH = os.path.join(
     ROOT_DIR, 'samplesheets/tests/config/ext_links.json'
 )
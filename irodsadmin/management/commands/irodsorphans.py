@@ -265,11 +265,11 @@ class Command(BaseCommand):
         m = re.search(pattern, path)
         if m:
             uuid = m.group(2)
-            try:
-                project = Project.objects.get(sodar_uuid=uuid)
-                title = project.full_title
-            except Project.DoesNotExist:
-                title = DELETED
+            title = (
+                Project.objects.filter(sodar_uuid=uuid)
+                .values_list('full_title', flat=True)
+                .first()
+            ) or DELETED
         else:
             uuid = ERROR
             title = ERROR
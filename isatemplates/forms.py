@@ -271,13 +271,19 @@ class ISATemplateForm(forms.ModelForm):
                             del_count, 's' if del_count != 1 else ''
                         )
                     )
-            for k, v in self.file_data['files'].items():
-                file = CookiecutterISAFile.objects.create(
-                    template=template, file_name=k, content=v
-                )
+            # NOTE: File name prefixes are already checked in _get_files_*()
+            files = CookiecutterISAFile.objects.bulk_create(
+                [
+                    CookiecutterISAFile(
+                        template=template, file_name=k, content=v
+                    )
+                    for k, v in self.file_data['files'].items()
+                ]
+            )
+            for file in files:
                 logger.debug(
                     'Created ISA template file: {} ({})'.format(
-                        k, file.sodar_uuid
+                        file.file_name, file.sodar_uuid
                     )
                 )
         # Validate template content
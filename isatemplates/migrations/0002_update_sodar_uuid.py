@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-15 10:51
+
+from django.db import migrations, models
+import sodar.utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('isatemplates', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cookiecutterisafile',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='cookiecutterisatemplate',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+    ]
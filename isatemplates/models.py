@@ -1,7 +1,7 @@
 """Models for the isatemplates app"""
 
 import json
-import uuid
+import re
 
 from cubi_isa_templates import _TEMPLATES as CUBI_TEMPLATES
 from collections import OrderedDict
@@ -11,6 +11,9 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.utils.text import slugify
 
+# Local helper for generating UUIDs
+from sodar.utils import get_uuid7
+
 
 AUTH_USER_MODEL = getattr(settings, 'AUTH_USER_MODEL', 'auth.User')
 
@@ -20,6 +23,10 @@ ISA_FILE_PREFIXES = ['i_', 's_', 'a_']
 INVALID_FILE_PREFIX_MSG = (
     'Invalid file name, must start with one of: {}'
 ).format(', '.join(ISA_FILE_PREFIXES))
+CUBI_TEMPLATE_NAMES = {t.name for t in CUBI_TEMPLATES}
+CUBI_TEMPLATE_DESCRIPTIONS = {t.description.lower() for t in CUBI_TEMPLATES}
+# Template name already in slugified form
+NAME_SLUG_RE = re.compile(r'[a-z0-9]+(?:_[a-z0-9]+)*')
 
 
 class CookiecutterISATemplate(models.Model):
@@ -72,7 +79,7 @@ class CookiecutterISATemplate(models.Model):
 
     #: SODAR UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     def __str__(self):
@@ -94,18 +101,17 @@ class CookiecutterISATemplate(models.Model):
 
     def _validate_cubi(self):
         """Validate uniqueness with CUBI templates"""
-        if self.name in [t.name for t in CUBI_TEMPLATES]:
+        if self.name in CUBI_TEMPLATE_NAMES:
             raise ValidationError('Name found in CUBI templates')
-        if self.description.lower() in [
-            t.description.lower() for t in CUBI_TEMPLATES
-        ]:
+        if self.description.lower() in CUBI_TEMPLATE_DESCRIPTIONS:
             raise ValidationError('Description found in CUBI templates')
 
     def save(self, **kwargs):
         if not self.name:  # Auto-generate name if not filled
             self.name = self.description[:255]
-        # Force slugify on name
-        self.name = slugify(self.name.lower()).replace('-', '_')
+        # Force slugify on name unless already done
+        if not NAME_SLUG_RE.fullmatch(self.name):
+            self.name = slugify(self.name.lower()).replace('-', '_')
         # Validate against CUBI templates (NOTE: also if disabled)
         self._validate_cubi()
         super().save(**kwargs)
@@ -146,7 +152,7 @@ class CookiecutterISAFile(models.Model):
 
     #: SODAR UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     def __str__(self):
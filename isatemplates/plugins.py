@@ -12,6 +12,8 @@ from isatemplates.urls import urlpatterns
 
 # Local constants
 ISATEMPLATES_INFO_SETTINGS = ['ISATEMPLATES_ENABLE_CUBI_TEMPLATES']
+# Models supported in get_object_link()
+LINK_MODELS = {'CookiecutterISATemplate': CookiecutterISATemplate}
 
 
 class SiteAppPlugin(SiteAppPluginPoint):
@@ -50,7 +52,10 @@ class SiteAppPlugin(SiteAppPluginPoint):
         :param uuid: sodar_uuid of the referred object
         :return: Dict or None if not found
         """
-        obj = self.get_object(eval(model_str), uuid)
+        model = LINK_MODELS.get(model_str)
+        if not model:
+            return None
+        obj = self.get_object(model, uuid)
         if not obj:
             return None
         if obj.__class__ == CookiecutterISATemplate:
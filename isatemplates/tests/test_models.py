@@ -128,6 +128,21 @@ class TestCookiecutterISATemplate(
             self.template.name, slugify(name.lower()).replace('-', '_')
         )
 
+    def test_save_empty_name_desc_trailing_newline(self):
+        """Test save() with empty name and trailing newline in description"""
+        self.template.name = None
+        self.template.description = 'abc\n'
+        self.template.save()
+        self.template.refresh_from_db()
+        self.assertEqual(self.template.name, 'abc')
+
+    def test_save_slugified_name_trailing_whitespace(self):
+        """Test save() with slugified name followed by whitespace"""
+        self.template.name = 'abc_def \n'
+        self.template.save()
+        self.template.refresh_from_db()
+        self.assertEqual(self.template.name, 'abc_def')
+
     def test_save_empty_name_long_desc(self):
         """Test save() with empty name and long description"""
         desc = ''.join(random.choice(string.ascii_letters) for _ in range(2048))
@@ -2,5 +2,11 @@ from django.contrib import admin
 
 from .models import LandingZone
 
+
+class LandingZoneAdmin(admin.ModelAdmin):
+    # Avoid per-row queries in __str__()
+    list_select_related = ['project', 'user']
+
+
 # Register your models here.
-admin.site.register(LandingZone)
+admin.site.register(LandingZone, LandingZoneAdmin)
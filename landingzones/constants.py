@@ -56,36 +56,44 @@ STATUS_STYLES = {
 }
 
 # Status types for which zone validation, moving and deletion are allowed
-STATUS_ALLOW_UPDATE = [ZONE_STATUS_ACTIVE, ZONE_STATUS_FAILED]
+STATUS_ALLOW_UPDATE = frozenset({ZONE_STATUS_ACTIVE, ZONE_STATUS_FAILED})
 
 # Status types for zones for which activities have finished
-STATUS_FINISHED = [
-    ZONE_STATUS_MOVED,
-    ZONE_STATUS_NOT_CREATED,
-    ZONE_STATUS_DELETED,
-]
+STATUS_FINISHED = frozenset(
+    {
+        ZONE_STATUS_MOVED,
+        ZONE_STATUS_NOT_CREATED,
+        ZONE_STATUS_DELETED,
+    }
+)
 
 # Status types which lock the project in Taskflow
-STATUS_LOCKING = [
-    ZONE_STATUS_PREPARING,
-    ZONE_STATUS_VALIDATING,
-    ZONE_STATUS_MOVING,
-]
+STATUS_LOCKING = frozenset(
+    {
+        ZONE_STATUS_PREPARING,
+        ZONE_STATUS_VALIDATING,
+        ZONE_STATUS_MOVING,
+    }
+)
 
 # Status types for busy landing zones
-STATUS_BUSY = [
-    ZONE_STATUS_CREATING,
-    ZONE_STATUS_PREPARING,
-    ZONE_STATUS_VALIDATING,
-    ZONE_STATUS_MOVING,
-    ZONE_STATUS_DELETING,
-]
+STATUS_BUSY = frozenset(
+    {
+        ZONE_STATUS_CREATING,
+        ZONE_STATUS_PREPARING,
+        ZONE_STATUS_VALIDATING,
+        ZONE_STATUS_MOVING,
+        ZONE_STATUS_DELETING,
+    }
+)
 
 # Status types during which file lists and stats should be displayed
-STATUS_DISPLAY_FILES = [
-    ZONE_STATUS_ACTIVE,
-    ZONE_STATUS_PREPARING,
-    ZONE_STATUS_VALIDATING,
-    ZONE_STATUS_MOVING,
-    ZONE_STATUS_FAILED,
-]
+STATUS_DISPLAY_FILES = frozenset(
+    {
+        ZONE_STATUS_ACTIVE,
+        ZONE_STATUS_PREPARING,
+        ZONE_STATUS_VALIDATING,
+        ZONE_STATUS_MOVING,
+        ZONE_STATUS_FAILED,
+    }
+)
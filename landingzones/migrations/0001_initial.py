@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.11 on 2018-04-24 13:12
-from __future__ import unicode_literals
 
 from django.conf import settings
 from django.db import migrations, models
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.12 on 2018-05-03 16:02
-from __future__ import unicode_literals
 
 from django.db import migrations, models
 
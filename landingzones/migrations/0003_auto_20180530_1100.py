@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.13 on 2018-05-30 09:00
-from __future__ import unicode_literals
 
 from django.db import migrations
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.16 on 2018-10-23 10:59
-from __future__ import unicode_literals
 
 from django.db import migrations, models
 import uuid
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.25 on 2026-10-15 08:08
+
+from django.db import migrations, models
+import sodar.utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landingzones', '0008_landingzone_user_message'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='landingzone',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='Landing zone SODAR UUID', unique=True),
+        ),
+    ]
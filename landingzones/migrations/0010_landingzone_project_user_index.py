@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 08:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('landingzones', '0009_update_sodar_uuid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='landingzone',
+            index=models.Index(fields=['project', 'user'], name='landingzone_project_de9886_idx'),
+        ),
+    ]
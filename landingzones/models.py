@@ -1,8 +1,9 @@
-import uuid
-
 from django.conf import settings
 from django.db import models
 
+# Local helper for generating UUIDs
+from sodar.utils import get_uuid7
+
 # Projectroles dependency
 from projectroles.models import Project
 
@@ -104,13 +105,15 @@ class LandingZone(models.Model):
 
     #: Landing zone SODAR UUID
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='Landing zone SODAR UUID'
+        default=get_uuid7, unique=True, help_text='Landing zone SODAR UUID'
     )
 
     class Meta:
         ordering = ['project', 'assay__file_name', 'title']
         # Ensure name is unique within project and user
         unique_together = ('title', 'project', 'user')
+        # Speed up zone lookups for a user within a project
+        indexes = [models.Index(fields=['project', 'user'])]
 
     def __str__(self):
         return '{}: {}/{}'.format(
@@ -136,7 +139,7 @@ class LandingZone(models.Model):
             self.status_info = status_info
         else:
             self.status_info = lc.DEFAULT_STATUS_INFO[status][:1024]
-        self.save()
+        self.save(update_fields=['status', 'status_info', 'date_modified'])
 
     def is_locked(self):
         """
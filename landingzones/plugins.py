@@ -2,6 +2,9 @@
 
 import logging
 
+from irods.column import In
+from irods.models import Collection
+
 from django.urls import reverse
 
 from djangoplugins.point import PluginPoint
@@ -38,6 +41,8 @@ LANDINGZONES_INFO_SETTINGS = [
     'LANDINGZONES_TRIGGER_FILE',
     'LANDINGZONES_TRIGGER_MOVE_INTERVAL',
 ]
+# Models supported in get_object_link()
+LINK_MODELS = {'LandingZone': LandingZone, 'Assay': Assay}
 
 
 # Landingzones project app plugin ----------------------------------------------
@@ -130,7 +135,10 @@ class ProjectAppPlugin(
         :param uuid: sodar_uuid of the referred object
         :return: Dict or None if not found
         """
-        obj = self.get_object(eval(model_str), uuid)
+        model = LINK_MODELS.get(model_str)
+        if not model:
+            return None
+        obj = self.get_object(model, uuid)
         if not obj:
             return None
         if obj.__class__ == LandingZone and obj.status != ZONE_STATUS_MOVED:
@@ -198,19 +206,22 @@ class ProjectAppPlugin(
         """
         if not user or user.is_anonymous or column_id != 'zones':
             return ''
-        investigation = Investigation.objects.filter(
-            project=project, active=True
-        ).first()
-        kw = {'project': project}
-        if not user.is_superuser:
-            kw['user'] = user
-        active_count = (
-            LandingZone.objects.filter(**kw)
-            .exclude(status__in=STATUS_FINISHED)
-            .count()
-        )
+        # Zones are only available if project collections exist in iRODS
+        irods_status = Investigation.objects.filter(
+            project=project, active=True, irods_status=True
+        ).exists()
+        active_count = 0
+        if irods_status:
+            kw = {'project': project}
+            if not user.is_superuser:
+                kw['user'] = user
+            active_count = (
+                LandingZone.objects.filter(**kw)
+                .exclude(status__in=STATUS_FINISHED)
+                .count()
+            )
 
-        if investigation and investigation.irods_status and active_count > 0:
+        if irods_status and active_count > 0:
             return (
                 '<a href="{}" title="{}" class="sodar-lz-project-list-active">'
                 # 'data-toggle="tooltip" data-placement="top">'
@@ -227,10 +238,8 @@ class ProjectAppPlugin(
                     ),
                 )
             )
-        elif (
-            investigation
-            and investigation.irods_status
-            and user.has_perm('landingzones.create_zone', project)
+        elif irods_status and user.has_perm(
+            'landingzones.create_zone', project
         ):
             return (
                 '<a href="{}" title="Create landing zone in project" '
@@ -263,8 +272,8 @@ class ProjectAppPlugin(
         """
         zones = LandingZone.objects.filter(
             project=project, status__in=STATUS_ALLOW_UPDATE
-        )
-        if zones.count() == 0:
+        ).select_related('project', 'user', 'assay', 'assay__study')
+        if not zones.exists():
             logger.debug('Skipping: No active zones found')
             return
 
@@ -274,10 +283,15 @@ class ProjectAppPlugin(
             logger.debug('Skipping: Required backend plugins not active')
             return
 
+        zone_paths = {z.pk: irods_backend.get_path(z) for z in zones}
         with irods_backend.get_session() as irods:
+            # Get existing zone collections with a single query
+            query = irods.query(Collection.name).filter(
+                In(Collection.name, list(zone_paths.values()))
+            )
+            coll_paths = set(row[Collection.name] for row in query)
             for zone in zones:
-                zone_path = irods_backend.get_path(zone)
-                if irods.collections.exists(zone_path):
+                if zone_paths[zone.pk] in coll_paths:
                     continue  # Skip if already there
                 logger.info('Syncing landing zone "{}"..'.format(zone.title))
                 self.submit_create(zone, create_colls=True, sync=True)
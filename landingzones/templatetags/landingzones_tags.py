@@ -20,11 +20,7 @@ register = template.Library()
 
 @register.simple_tag
 def get_status_style(zone):
-    return (
-        STATUS_STYLES[zone.status]
-        if zone.status in STATUS_STYLES
-        else 'bg_faded'
-    )
+    return STATUS_STYLES.get(zone.status, 'bg_faded')
 
 
 @register.simple_tag
@@ -136,3 +136,34 @@ class TestGetStatistics(LandingzonesPluginTestBase):
                 'zones_busy': 0,
             }
         )
+
+
+class TestGetProjectListValue(LandingzonesPluginTestBase):
+    """Tests for get_project_list_value()"""
+
+    def test_get_value_active(self):
+        """Test get_project_list_value() with active zone"""
+        self.make_landing_zone(
+            'zone_active', self.project, self.user_owner, self.assay
+        )
+        value = self.plugin.get_project_list_value(
+            'zones', self.project, self.user_owner
+        )
+        self.assertIn('sodar-lz-project-list-active', value)
+
+    def test_get_value_create(self):
+        """Test get_project_list_value() with no zones"""
+        value = self.plugin.get_project_list_value(
+            'zones', self.project, self.user_owner
+        )
+        self.assertIn('sodar-lz-project-list-create', value)
+
+    def test_get_value_no_colls(self):
+        """Test get_project_list_value() with no project iRODS collections"""
+        self.investigation.irods_status = False
+        self.investigation.save()
+        with self.assertNumQueries(1):
+            value = self.plugin.get_project_list_value(
+                'zones', self.project, self.user_owner
+            )
+        self.assertIn('sodar-lz-project-list-none', value)
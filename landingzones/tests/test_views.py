@@ -8,14 +8,11 @@ from test_plus.test import TestCase
 
 # Projectroles dependency
 from projectroles.models import SODAR_CONSTANTS
-from projectroles.tests.test_models import (
-    ProjectMixin,
-    RoleMixin,
-    RoleAssignmentMixin,
-)
+from projectroles.tests.test_models import ProjectMixin, RoleAssignmentMixin
 
 # Samplesheets dependency
 from samplesheets.tests.test_io import SampleSheetIOMixin, SHEET_DIR
+from samplesheets.tests.test_models import RoleFixtureMixin
 
 from landingzones.constants import ZONE_STATUS_ACTIVE, ZONE_STATUS_DELETED
 from landingzones.models import LandingZone
@@ -41,7 +38,7 @@ ZONE_STATUS_INFO = 'Testing'
 
 class TestViewsBase(
     ProjectMixin,
-    RoleMixin,
+    RoleFixtureMixin,
     RoleAssignmentMixin,
     SampleSheetIOMixin,
     LandingZoneMixin,
@@ -49,35 +46,37 @@ class TestViewsBase(
 ):
     """Base class for view testing"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
+        # NOTE: Shared by all tests in the class, modifications are rolled back
         # Init roles
-        self.init_roles()
+        cls.init_roles_class()
         # Init superuser
-        self.user = self.make_user('superuser')
-        self.user.is_superuser = True
-        self.user.save()
+        cls.user = cls.make_user('superuser')
+        cls.user.is_superuser = True
+        cls.user.save()
         # Init project with owner
-        self.project = self.make_project(
+        cls.project = cls.make_project(
             'TestProject', PROJECT_TYPE_PROJECT, None
         )
-        self.owner_as = self.make_assignment(
-            self.project, self.user, self.role_owner
+        cls.owner_as = cls.make_assignment(
+            cls.project, cls.user, cls.role_owner
         )
         # Init contributor user and assignment
-        self.user_contributor = self.make_user('user_contributor')
-        self.contributor_as = self.make_assignment(
-            self.project, self.user_contributor, self.role_contributor
+        cls.user_contributor = cls.make_user('user_contributor')
+        cls.contributor_as = cls.make_assignment(
+            cls.project, cls.user_contributor, cls.role_contributor
         )
         # Import investigation
-        self.investigation = self.import_isa_from_file(SHEET_PATH, self.project)
-        self.study = self.investigation.studies.first()
-        self.assay = self.study.assays.first()
+        cls.investigation = cls.import_isa_from_file(SHEET_PATH, cls.project)
+        cls.study = cls.investigation.studies.first()
+        cls.assay = cls.study.assays.first()
         # Create LandingZone
-        self.landing_zone = self.make_landing_zone(
+        cls.landing_zone = cls.make_landing_zone(
             title=ZONE_TITLE,
-            project=self.project,
-            user=self.user,
-            assay=self.assay,
+            project=cls.project,
+            user=cls.user,
+            assay=cls.assay,
             description=ZONE_DESC,
             status=ZONE_STATUS_ACTIVE,
         )
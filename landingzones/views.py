@@ -419,12 +419,15 @@ class ProjectZoneView(
         context['irods_backend_enabled'] = (
             True if get_backend_api('omics_irods') else False
         )
+        # Related objects used in rendering each zone
+        zone_related = ['user', 'assay__study__investigation__project']
         # User zones
         context['zones_own'] = (
             LandingZone.objects.filter(
                 project=context['project'], user=self.request.user
             )
             .exclude(status__in=STATUS_FINISHED)
+            .select_related(*zone_related)
             .order_by('title')
         )
         # Other zones
@@ -436,6 +439,7 @@ class ProjectZoneView(
                 LandingZone.objects.filter(project=context['project'])
                 .exclude(user=self.request.user)
                 .exclude(status__in=STATUS_FINISHED)
+                .select_related(*zone_related)
                 .order_by('user__username', 'title')
             )
         # Status query interval
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.29 on 2020-09-24 11:53
-from __future__ import unicode_literals
 
 import django.contrib.postgres.fields
 from django.db import migrations, models
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.29 on 2020-10-23 12:17
-from __future__ import unicode_literals
 
 from django.db import migrations, models
 
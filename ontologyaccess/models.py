@@ -1,11 +1,12 @@
 """Models for the ontologyaccess app"""
 
-import uuid
-
 from django.contrib.postgres.fields import ArrayField
 from django.core.exceptions import ValidationError
 from django.db import models
 
+# Local helper for generating UUIDs
+from sodar.utils import get_uuid7
+
 # Local constants
 DEFAULT_LENGTH = 255
 DEFAULT_TERM_URL = 'http://purl.obolibrary.org/obo/{id_space}_{local_id}'
@@ -111,7 +112,7 @@ class OBOFormatOntology(models.Model):
 
     #: SODAR UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     class Meta:
@@ -236,7 +237,7 @@ class OBOFormatOntologyTerm(models.Model):
 
     #: SODAR UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     # Custom row-level functions
@@ -62,51 +62,24 @@ class OntologyAccessPermissionTestBase(
 class TestOntologyAccessPermissions(OntologyAccessPermissionTestBase):
     """Tests for ontologyaccess UI view permissions"""
 
-    def test_get_ontology_list(self):
-        """Test OBOFormatOntologyListView GET"""
-        url = reverse('ontologyaccess:list')
+    #: View URL names and whether they take the ontology as a URL kwarg
+    VIEW_URLS = [
+        ('ontologyaccess:list', False),  # OBOFormatOntologyListView
+        ('ontologyaccess:obo_detail', True),  # OBOFormatOntologyDetailView
+        ('ontologyaccess:obo_import', False),  # OBOFormatOntologyImportView
+        ('ontologyaccess:obo_update', True),  # OBOFormatOntologyUpdateView
+        ('ontologyaccess:obo_delete', True),  # OBOFormatOntologyDeleteView
+    ]
+
+    def test_get(self):
+        """Test ontologyaccess UI view GET"""
         good_users = [self.superuser]
         bad_users = [self.anonymous, self.regular_user]
-        self.assert_response(url, good_users, 200)
-        self.assert_response(url, bad_users, 302)
-
-    def test_get_ontology_detail(self):
-        """Test OBOFormatOntologyDetailView GET"""
-        url = reverse(
-            'ontologyaccess:obo_detail',
-            kwargs={'oboformatontology': self.ontology.sodar_uuid},
-        )
-        good_users = [self.superuser]
-        bad_users = [self.anonymous, self.regular_user]
-        self.assert_response(url, good_users, 200)
-        self.assert_response(url, bad_users, 302)
-
-    def test_get_ontology_import(self):
-        """Test OBOFormatOntologyImportView GET"""
-        url = reverse('ontologyaccess:obo_import')
-        good_users = [self.superuser]
-        bad_users = [self.anonymous, self.regular_user]
-        self.assert_response(url, good_users, 200)
-        self.assert_response(url, bad_users, 302)
-
-    def test_get_ontology_update(self):
-        """Test OBOFormatOntologyUpdateView GET"""
-        url = reverse(
-            'ontologyaccess:obo_update',
-            kwargs={'oboformatontology': self.ontology.sodar_uuid},
-        )
-        good_users = [self.superuser]
-        bad_users = [self.anonymous, self.regular_user]
-        self.assert_response(url, good_users, 200)
-        self.assert_response(url, bad_users, 302)
-
-    def test_ontology_delete(self):
-        """Test OBOFormatOntologyDeleteView GET"""
-        url = reverse(
-            'ontologyaccess:obo_delete',
-            kwargs={'oboformatontology': self.ontology.sodar_uuid},
-        )
-        good_users = [self.superuser]
-        bad_users = [self.anonymous, self.regular_user]
-        self.assert_response(url, good_users, 200)
-        self.assert_response(url, bad_users, 302)
+        for url_name, ontology_kwarg in self.VIEW_URLS:
+            kwargs = {}
+            if ontology_kwarg:
+                kwargs['oboformatontology'] = self.ontology.sodar_uuid
+            url = reverse(url_name, kwargs=kwargs)
+            with self.subTest(url=url):
+                self.assert_response(url, good_users, 200)
+                self.assert_response(url, bad_users, 302)
@@ -10,9 +10,37 @@ from .models import (
 )
 
 
-admin.site.register(Investigation)
-admin.site.register(Study)
-admin.site.register(Assay)
-admin.site.register(GenericMaterial)
-admin.site.register(Protocol)
-admin.site.register(Process)
+# NOTE: Related objects are selected for listing to avoid per-row queries in
+#       __str__() of each model
+
+
+class InvestigationAdmin(admin.ModelAdmin):
+    list_select_related = ['project']
+
+
+class StudyAdmin(admin.ModelAdmin):
+    list_select_related = ['investigation__project']
+
+
+class AssayAdmin(admin.ModelAdmin):
+    list_select_related = ['study__investigation__project']
+
+
+class GenericMaterialAdmin(admin.ModelAdmin):
+    list_select_related = ['study__investigation__project', 'assay__study']
+
+
+class ProtocolAdmin(admin.ModelAdmin):
+    list_select_related = ['study__investigation__project']
+
+
+class ProcessAdmin(admin.ModelAdmin):
+    list_select_related = ['study__investigation__project', 'assay__study']
+
+
+admin.site.register(Investigation, InvestigationAdmin)
+admin.site.register(Study, StudyAdmin)
+admin.site.register(Assay, AssayAdmin)
+admin.site.register(GenericMaterial, GenericMaterialAdmin)
+admin.site.register(Protocol, ProtocolAdmin)
+admin.site.register(Process, ProcessAdmin)
@@ -89,7 +89,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         if mc_assay_name:
             return assay_path + '/' + mc_assay_name
 
-    def update_row(self, row, table, assay, index):
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -97,6 +97,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param table: Full table (list of lists)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: Top headers by column index (list, optional)
         :return: List of dicts
         """
         if not settings.IRODS_WEBDAV_ENABLED or not assay:
@@ -111,9 +112,13 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
 
         base_url = settings.IRODS_WEBDAV_URL + assay_path
 
+        top_headers = table_ctx
+        if top_headers is None:
+            top_headers = self.get_table_context(table, assay)
+
         for i in range(len(row)):
             header = table['field_header'][i]
-            top_header = get_top_header(table, i)
+            top_header = top_headers[i]
 
             # Create barcode key & antibody panel links in processes
             if (
@@ -80,7 +80,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
             return assay_path + '/' + last_material_name
         return None
 
-    def update_row(self, row, table, assay, index):
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -88,6 +88,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param table: Full table (list of lists)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: Return data of get_table_context() (optional)
         :return: List of dicts
         """
         return row
@@ -1,12 +1,15 @@
 """Assay app plugin for samplesheets"""
 
 import re
+
+from collections import namedtuple
+
 from django.conf import settings
 
 from altamisa.constants import table_headers as th
 from samplesheets.plugins import SampleSheetAssayPluginPoint
 from samplesheets.rendering import SIMPLE_LINK_TEMPLATE
-from samplesheets.utils import get_top_header
+from samplesheets.utils import get_top_headers
 from samplesheets.views import MISC_FILES_COLL, RESULTS_COLL
 
 
@@ -16,6 +19,27 @@ RESULTS_COMMENT = 'SODAR Assay Link Results'
 MISC_FILES_COMMENT = 'SODAR Assay Link MiscFiles'
 DATA_COMMENT_PREFIX = 'SODAR Assay Row Path'
 DATA_LINK_COMMENT = 'SODAR Assay Link Row'
+# Regex for cell values already containing a link, equal to '.+ <.*>'
+LINK_RE = re.compile(r'. <.*>')
+# Top headers for which the Name column is linked directly
+NAME_LINK_HEADERS = frozenset(th.DATA_FILE_HEADERS + th.MATERIAL_NAME_HEADERS)
+
+# Per-assay link context, parsed once from assay comments
+AssayLinkContext = namedtuple(
+    'AssayLinkContext',
+    [
+        'assay_path',
+        'base_url',
+        'results_cols',
+        'misc_cols',
+        'data_cols',
+        'data_columns',
+    ],
+)
+# Per-table lookups, built once per table in get_table_context()
+TableIndex = namedtuple(
+    'TableIndex', ['assay_ctx', 'header_index', 'link_cols']
+)
 
 
 class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
@@ -57,69 +81,115 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param top_header: Column top header
         :param target_cols: List of column names.
         :param url: Base URL for link target.
+        :return: True if no further links should be created for the cell
         """
+        value = cell['value']
         # Do nothing if not string or link
-        if not isinstance(cell['value'], str) or re.search(
-            '.+ <.*>', cell['value']
-        ):
+        if not isinstance(value, str) or LINK_RE.search(value):
             return True
         # Special case for Material Names
-        if (
-            top_header['value']
-            in th.DATA_FILE_HEADERS + th.MATERIAL_NAME_HEADERS
-        ) and (header['value'] == 'Name'):
-            cell['link'] = f"{url}/{cell['value']}"
+        if top_header['value'] in NAME_LINK_HEADERS and (
+            header['value'] == 'Name'
+        ):
+            cell['link'] = f'{url}/{value}'
             return True
         # Handle everything else
         if header['value'].lower() in target_cols:
             cell['value'] = SIMPLE_LINK_TEMPLATE.format(
-                label=cell['value'],
-                url=f"{url}/{cell['value']}",
+                label=value, url=f'{url}/{value}'
             )
             return True
+        return False
+
+    @staticmethod
+    def _split_comment(assay, comment):
+        """
+        Return lowercase column names from a semicolon separated comment.
+
+        :param assay: Assay object
+        :param comment: Comment name (string)
+        :return: List or None
+        """
+        value = assay.comments.get(comment)
+        return value.lower().split(';') if value else None
+
+    @staticmethod
+    def _get_data_columns(assay):
+        """
+        Return row path column names from assay comments starting with
+        DATA_COMMENT_PREFIX, sorted by comment name.
+
+        :param assay: Assay object
+        :return: List
+        """
+        return [
+            value
+            for name, value in sorted(assay.comments.items())
+            if name.startswith(DATA_COMMENT_PREFIX)
+        ]
+
+    def _get_assay_context(self, assay):
+        """
+        Return link context parsed from assay comments.
+
+        :param assay: Assay object
+        :return: AssayLinkContext
+        """
+        assay_path = self.get_assay_path(assay)
+        return AssayLinkContext(
+            assay_path=assay_path,
+            base_url=(
+                settings.IRODS_WEBDAV_URL + assay_path if assay_path else None
+            ),
+            results_cols=self._split_comment(assay, RESULTS_COMMENT),
+            misc_cols=self._split_comment(assay, MISC_FILES_COMMENT),
+            data_cols=self._split_comment(assay, DATA_LINK_COMMENT),
+            data_columns=self._get_data_columns(assay),
+        )
+
+    @staticmethod
+    def _get_header_index(table):
+        """
+        Return dict of lowercase field header values mapped to column index.
+        For duplicate headers the last index is kept.
+
+        :param table: Full table with headers (dict returned by
+                      SampleSheetTableBuilder)
+        :return: Dict
+        """
+        return {
+            h['value'].lower(): i for i, h in enumerate(table['field_header'])
+        }
 
     @classmethod
-    def _get_col_value(cls, target_col, row, table):
+    def _get_col_value(cls, target_col, row, header_index):
         """
         Return value of last matched column.
 
         :param target_col: Column name to look for
         :param row: List of dicts (a row returned by SampleSheetTableBuilder)
-        :param table: Full table with headers (dict returned by
-                      SampleSheetTableBuilder)
+        :param header_index: Dict of lowercase header values and column indices
         :return: String with cell value of last matched column
         """
-        # Returns last match of row
-        value = None
-        if target_col:
-            for i in range(len(row)):
-                header = table['field_header'][i]
-                if header['value'].lower() == target_col.lower():
-                    value = row[i]['value']
-        return value
+        if not target_col:
+            return None
+        i = header_index.get(target_col.lower())
+        return row[i]['value'] if i is not None else None
 
-    def get_row_path(self, row, table, assay, assay_path):
+    @classmethod
+    def _get_row_path(cls, row, assay_path, header_index, data_columns):
         """
-        Return iRODS path for an assay row in a sample sheet. If None,
-        display default path. Used if display_row_links = True.
+        Return iRODS path for an assay row using a field header index.
 
         :param row: List of dicts (a row returned by SampleSheetTableBuilder)
-        :param table: Full table with headers (dict returned by
-                      SampleSheetTableBuilder)
-        :param assay: Assay object
         :param assay_path: Root path for assay
+        :param header_index: Dict of lowercase header values and column indices
+        :param data_columns: List of row path column names
         :return: String with full iRODS path or None
         """
-        # Extract comments starting with DATA_COMMENT_PREFIX; sorted
-        data_columns = [
-            value
-            for name, value in sorted(assay.comments.items())
-            if name.startswith(DATA_COMMENT_PREFIX)
-        ]
-
         data_collections = []
         for column_name in data_columns:
-            col_value = self._get_col_value(column_name, row, table)
+            col_value = cls._get_col_value(column_name, row, header_index)
             if col_value:
                 data_collections.append(col_value)
 
@@ -129,7 +199,60 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
             return assay_path + data_path
         return None
 
-    def update_row(self, row, table, assay, index):
+    def get_row_path(self, row, table, assay, assay_path):
+        """
+        Return iRODS path for an assay row in a sample sheet. If None,
+        display default path. Used if display_row_links = True.
+
+        :param row: List of dicts (a row returned by SampleSheetTableBuilder)
+        :param table: Full table with headers (dict returned by
+                      SampleSheetTableBuilder)
+        :param assay: Assay object
+        :param assay_path: Root path for assay
+        :return: String with full iRODS path or None
+        """
+        return self._get_row_path(
+            row,
+            assay_path,
+            self._get_header_index(table),
+            self._get_data_columns(assay),
+        )
+
+    def get_table_context(self, table, assay):
+        """
+        Return lookups for an assay table: the link context parsed from assay
+        comments, the field header index for row paths and the columns which
+        can receive links with the assay link context, as a list of tuples of
+        column index, field header and top header. Other cells are never
+        modified by update_row(), so they can be skipped for all rows.
+
+        :param table: Full table with headers (dict returned by
+                      SampleSheetTableBuilder)
+        :param assay: Assay object
+        :return: TableIndex
+        """
+        ctx = self._get_assay_context(assay)
+        target_cols = set()
+        for cols in [ctx.results_cols, ctx.misc_cols, ctx.data_cols]:
+            target_cols.update(cols or [])
+        link_cols = [
+            (i, header, top_header)
+            for i, (header, top_header) in enumerate(
+                zip(table['field_header'], get_top_headers(table))
+            )
+            if (
+                top_header['value'] in NAME_LINK_HEADERS
+                and header['value'] == 'Name'
+            )
+            or header['value'].lower() in target_cols
+        ]
+        return TableIndex(
+            assay_ctx=ctx,
+            header_index=self._get_header_index(table),
+            link_cols=link_cols,
+        )
+
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -137,68 +260,52 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param table: Full table (dict)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: TableIndex returned by get_table_context() (optional)
         :return: List of dicts
         """
         if not settings.IRODS_WEBDAV_ENABLED or not assay:
             return row
-        assay_path = self.get_assay_path(assay)
-        if not assay_path:
+        if table_ctx is None:
+            table_ctx = self.get_table_context(table, assay)
+        ctx = table_ctx.assay_ctx
+        if not ctx.assay_path or not (
+            ctx.results_cols or ctx.misc_cols or ctx.data_cols
+        ):
             return row
 
-        base_url = settings.IRODS_WEBDAV_URL + assay_path
-        top_header = None
-        th_colspan = 0
-
-        results_cols = assay.comments.get(RESULTS_COMMENT)
-        if results_cols:
-            results_cols = results_cols.lower().split(';')
-        misc_cols = assay.comments.get(MISC_FILES_COMMENT)
-        if misc_cols:
-            misc_cols = misc_cols.lower().split(';')
-        data_cols = assay.comments.get(DATA_LINK_COMMENT)
+        link = self._link_from_comment
+        results_cols = ctx.results_cols
+        results_url = f'{ctx.base_url}/{RESULTS_COLL}'
+        misc_cols = ctx.misc_cols
+        misc_url = f'{ctx.base_url}/{MISC_FILES_COLL}'
+        data_cols = ctx.data_cols
         if data_cols:
-            data_cols = data_cols.lower().split(';')
+            # NOTE: Resolved before the loop from unmodified cell values
             if table['irods_paths'][index]:
                 row_path = table['irods_paths'][index]['path']
             else:
-                row_path = self.get_row_path(row, table, assay, assay_path)
-
-        for i in range(len(row)):
-            header = table['field_header'][i]
-            if not top_header or i >= th_colspan:
-                top_header = get_top_header(table, i)
-                th_colspan += top_header['colspan']
+                row_path = self._get_row_path(
+                    row,
+                    ctx.assay_path,
+                    table_ctx.header_index,
+                    ctx.data_columns,
+                )
+            data_url = f'{settings.IRODS_WEBDAV_URL}{row_path}'
 
+        for i, header, top_header in table_ctx.link_cols:
+            cell = row[i]
             # TODO: Check if two comments reference the same column header?
             # Create Results links
             if results_cols:
-                if self._link_from_comment(
-                    row[i],
-                    header,
-                    top_header,
-                    results_cols,
-                    f'{base_url}/{RESULTS_COLL}',
-                ):
+                if link(cell, header, top_header, results_cols, results_url):
                     continue
             # Create MiscFiles links
             if misc_cols:
-                if self._link_from_comment(
-                    row[i],
-                    header,
-                    top_header,
-                    misc_cols,
-                    f'{base_url}/{MISC_FILES_COLL}',
-                ):
+                if link(cell, header, top_header, misc_cols, misc_url):
                     continue
             # Create DataCollection links
             if data_cols:
-                self._link_from_comment(
-                    row[i],
-                    header,
-                    top_header,
-                    data_cols,
-                    f'{settings.IRODS_WEBDAV_URL}{row_path}',
-                )
+                link(cell, header, top_header, data_cols, data_url)
         return row
 
     def update_cache(self, name=None, project=None, user=None):
@@ -5,7 +5,6 @@ from django.conf import settings
 # from samplesheets.models import GenericMaterial, Process
 from samplesheets.plugins import SampleSheetAssayPluginPoint
 from samplesheets.rendering import SIMPLE_LINK_TEMPLATE
-from samplesheets.utils import get_top_header
 from samplesheets.views import MISC_FILES_COLL, RESULTS_COLL
 
 
@@ -64,7 +63,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         # TODO: Alternatives for RawData?
         return assay_path + '/' + RAW_DATA_COLL
 
-    def update_row(self, row, table, assay, index):
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -72,6 +71,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param table: Full table (list of lists)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: Top headers by column index (list, optional)
         :return: List of dicts
         """
         if not settings.IRODS_WEBDAV_ENABLED or not assay:
@@ -81,14 +81,13 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
             return row
 
         base_url = settings.IRODS_WEBDAV_URL + assay_path
-        top_header = None
-        th_colspan = 0
+        top_headers = table_ctx
+        if top_headers is None:
+            top_headers = self.get_table_context(table, assay)
 
         for i in range(len(row)):
             header = table['field_header'][i]
-            if not top_header or i >= th_colspan:
-                top_header = get_top_header(table, i)
-                th_colspan += top_header['colspan']
+            top_header = top_headers[i]
             # Data files
             if (
                 header['obj_cls'] == 'GenericMaterial'
@@ -6,7 +6,6 @@ from django.conf import settings
 from projectroles.models import SODAR_CONSTANTS
 
 from samplesheets.plugins import SampleSheetAssayPluginPoint
-from samplesheets.utils import get_top_header
 
 # SODAR constants
 PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
@@ -103,7 +102,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
 
         return None
 
-    def update_row(self, row, table, assay, index):
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -111,6 +110,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param table: Full table (list of lists)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: Top headers by column index (list, optional)
         :return: List of dicts
         """
         assay_path = self.get_assay_path(assay)
@@ -125,13 +125,16 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
             return row
 
         base_url = settings.IRODS_WEBDAV_URL + row_path
+        top_headers = table_ctx
+        if top_headers is None:
+            top_headers = self.get_table_context(table, assay)
 
         for i in range(len(row)):
             if (
                 table['field_header'][i]['value'].lower() == 'name'
                 and row[i]['value']
             ):
-                top_header = get_top_header(table, i)
+                top_header = top_headers[i]
                 if (
                     top_header['value'].lower() in LINKED_FILES
                     and row[i]['value']
@@ -67,7 +67,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         # TODO: Alternatives for RawData?
         return assay_path + '/' + RAW_DATA_COLL
 
-    def update_row(self, row, table, assay, index):
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -75,6 +75,7 @@ class SampleSheetAssayPlugin(SampleSheetAssayPluginPoint):
         :param table: Full table (list of lists)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: Return data of get_table_context() (optional)
         :return: List of dicts
         """
         if not settings.IRODS_WEBDAV_ENABLED or not assay:
@@ -77,6 +77,8 @@ MATERIAL_TYPE_MAP = {
 MATERIAL_TYPE_EXPORT_MAP = {'SOURCE': 'Source Name', 'SAMPLE': 'Sample Name'}
 
 SAMPLE_SEARCH_SUBSTR = '-sample-'
+# Max number of materials or processes inserted per query on import
+IMPORT_BATCH_SIZE = 1000
 PROTOCOL_UNKNOWN_NAME = 'Unknown'
 EMPTY_TABLE_ERR_MSG = (
     'No {items} in {class_name} "{file_name}": Importing sheets with empty '
@@ -424,7 +426,8 @@ class SampleSheetIO:
             material_vals.append(values)
 
         materials = GenericMaterial.objects.bulk_create(
-            [GenericMaterial(**v) for v in material_vals]
+            [GenericMaterial(**v) for v in material_vals],
+            batch_size=IMPORT_BATCH_SIZE,
         )
         obj_lookup.update({m.unique_name: m for m in materials})
         logger.debug(
@@ -488,7 +491,8 @@ class SampleSheetIO:
             process_vals.append(values)
 
         processes = Process.objects.bulk_create(
-            [Process(**v) for v in process_vals]
+            [Process(**v) for v in process_vals],
+            batch_size=IMPORT_BATCH_SIZE,
         )
         obj_lookup.update({p.unique_name: p for p in processes})
         logger.debug(
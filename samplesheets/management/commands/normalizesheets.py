@@ -14,9 +14,10 @@ from projectroles.models import Project, SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 
 from samplesheets.models import Investigation
-from samplesheets.rendering import STUDY_TABLE_CACHE_ITEM
-
-# from samplesheets.rendering import SampleSheetTableBuilder
+from samplesheets.rendering import (
+    SampleSheetTableBuilder,
+    STUDY_TABLE_CACHE_ITEM,
+)
 from samplesheets.views_ajax import SheetVersionMixin
 
 
@@ -96,6 +97,7 @@ class Command(SheetVersionMixin, BaseCommand):
                         th_count += 1
             if not check:
                 item.save()
+                SampleSheetTableBuilder.set_mem_cache(study, item.data)
         logger.info(
             '{} {} affected top header{} in render tables'.format(
                 'Found' if check else 'Renamed',
@@ -13,6 +13,10 @@ from samplesheets.utils import get_alt_names
 logger = ManagementCommandLogger(__name__)
 
 
+# Local constants
+BATCH_SIZE = 2000
+
+
 class Command(BaseCommand):
     help = 'Refreshes all alternative names for sample sheet materials'
 
@@ -22,9 +26,11 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         logger.info('Refreshing alternative names for materials..')
         with transaction.atomic():
-            for m in GenericMaterial.objects.all():
+            for m in GenericMaterial.objects.all().iterator(
+                chunk_size=BATCH_SIZE
+            ):
                 m.alt_names = get_alt_names(m.name)
-                m.save()
+                m.save(update_fields=['alt_names'])
         logger.info(
             '{} materials updated.'.format(GenericMaterial.objects.count())
         )
@@ -106,6 +106,7 @@ class Command(BaseCommand):
                         data=study_tables,
                         project=project,
                     )
+                    table_builder.set_mem_cache(study, study_tables)
                     logger.info('Set cache item "{}"'.format(item_name))
                     study_count += 1
                 except Exception as ex:
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.11 on 2018-04-18 12:32
-from __future__ import unicode_literals
 
 from django.db import migrations, models
 
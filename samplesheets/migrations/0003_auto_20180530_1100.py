@@ -1,16 +1,12 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.13 on 2018-05-30 09:00
-from __future__ import unicode_literals
 
 from django.db import migrations, models
 
 
 def set_investigations_active(apps, schema_editor):
     Investigation = apps.get_model('samplesheets', 'Investigation')
-
-    for investigation in Investigation.objects.all():
-        investigation.active = True
-        investigation.save()
+    Investigation.objects.update(active=True)
 
 
 class Migration(migrations.Migration):
@@ -1,21 +1,31 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.13 on 2018-07-24 13:33
-from __future__ import unicode_literals
 
 import django.contrib.postgres.fields
-from django.db import migrations, models, transaction
+from django.db import migrations, models
 
 from samplesheets.utils import get_alt_names
 
 
+BATCH_SIZE = 5000
+
+
 def populate_alt_names(apps, schema_editor):
     GenericMaterial = apps.get_model('samplesheets', 'GenericMaterial')
-
-    with transaction.atomic():
-        for m in GenericMaterial.objects.all():
-            if not m.alt_names:
-                m.alt_names = get_alt_names(m.name)
-                m.save()
+    materials = GenericMaterial.objects.filter(alt_names=[]).only(
+        'pk', 'name', 'alt_names'
+    )
+    batch = []
+
+    # NOTE: Update in batches to avoid retaining all materials in memory
+    for m in materials.iterator(chunk_size=BATCH_SIZE):
+        m.alt_names = get_alt_names(m.name)
+        batch.append(m)
+        if len(batch) >= BATCH_SIZE:
+            GenericMaterial.objects.bulk_update(batch, ['alt_names'])
+            batch = []
+    if batch:
+        GenericMaterial.objects.bulk_update(batch, ['alt_names'])
 
 
 class Migration(migrations.Migration):
@@ -33,5 +43,7 @@ class Migration(migrations.Migration):
                 db_index=True, default=list, help_text='Alternative names',
                 size=None),
         ),
-        migrations.RunPython(populate_alt_names),
+        migrations.RunPython(
+            populate_alt_names, reverse_code=migrations.RunPython.noop
+        ),
     ]
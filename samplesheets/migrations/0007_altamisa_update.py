@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.20 on 2019-06-11 11:48
-from __future__ import unicode_literals
 
 import django.contrib.postgres.fields
 import django.contrib.postgres.fields.jsonb
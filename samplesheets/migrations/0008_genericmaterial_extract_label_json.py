@@ -1,19 +1,31 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.20 on 2019-06-12 12:23
-from __future__ import unicode_literals
 
 import django.contrib.postgres.fields.jsonb
 from django.db import migrations
 
 
+BATCH_SIZE = 5000
+
+
 def populate_extract_label_json(apps, schema_editor):
     """Populate new JSON extract label field based on values in old field"""
     GenericMaterial = apps.get_model('samplesheets', 'GenericMaterial')
-
-    for material in GenericMaterial.objects.all():
-        if material.extract_label:
-            material.extract_label_json = {'value': material.extract_label}
-            material.save()
+    materials = (
+        GenericMaterial.objects.exclude(extract_label__isnull=True)
+        .exclude(extract_label='')
+        .only('pk', 'extract_label', 'extract_label_json')
+    )
+    batch = []
+
+    for material in materials.iterator(chunk_size=BATCH_SIZE):
+        material.extract_label_json = {'value': material.extract_label}
+        batch.append(material)
+        if len(batch) >= BATCH_SIZE:
+            GenericMaterial.objects.bulk_update(batch, ['extract_label_json'])
+            batch = []
+    if batch:
+        GenericMaterial.objects.bulk_update(batch, ['extract_label_json'])
 
 
 class Migration(migrations.Migration):
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.20 on 2019-06-12 12:34
-from __future__ import unicode_literals
 
 from django.db import migrations
 
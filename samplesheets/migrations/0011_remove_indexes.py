@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.21 on 2019-07-08 09:24
-from __future__ import unicode_literals
 
 from django.db import migrations
 
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.23 on 2019-09-03 12:48
-from __future__ import unicode_literals
 
 from django.conf import settings
 import django.contrib.postgres.fields
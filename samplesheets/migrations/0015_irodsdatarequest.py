@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.29 on 2021-02-18 17:28
-from __future__ import unicode_literals
 
 from django.conf import settings
 from django.db import migrations, models
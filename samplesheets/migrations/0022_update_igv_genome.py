@@ -13,11 +13,9 @@ NEW_GENOME = 'b37_1kg'
 def update_igv_genome(apps, old_id, new_id):
     """Update settings in database"""
     AppSetting = apps.get_model('projectroles', 'AppSetting')
-    for s in AppSetting.objects.filter(
+    AppSetting.objects.filter(
         app_plugin__name='samplesheets', name='igv_genome', value=old_id
-    ):
-        s.value = new_id
-        s.save()
+    ).update(value=new_id)
 
 
 def run(apps, schema_editor):
@@ -0,0 +1,59 @@
+# Generated by Django 3.2.25 on 2026-10-15 08:08
+
+from django.db import migrations, models
+import sodar.utils
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('samplesheets', '0022_update_igv_genome'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='assay',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='genericmaterial',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='investigation',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='irodsaccessticket',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='irodsdatarequest',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='isatab',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='process',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='protocol',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+        migrations.AlterField(
+            model_name='study',
+            name='sodar_uuid',
+            field=models.UUIDField(default=sodar.utils.get_uuid7, help_text='SODAR UUID for the object', unique=True),
+        ),
+    ]
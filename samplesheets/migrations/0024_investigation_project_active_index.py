@@ -0,0 +1,17 @@
+# Generated by Django 3.2.25 on 2026-10-15 08:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('samplesheets', '0023_update_sodar_uuid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='investigation',
+            index=models.Index(fields=['project', 'active'], name='samplesheet_project_a035a5_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.2.25 on 2026-10-15 09:25
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('samplesheets', '0024_investigation_project_active_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='genericmaterial',
+            name='alt_names',
+            field=django.contrib.postgres.fields.ArrayField(base_field=models.CharField(blank=True, max_length=255), default=list, help_text='Alternative names', size=None),
+        ),
+        migrations.AddIndex(
+            model_name='genericmaterial',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['alt_names'], name='material_alt_names_gin'),
+        ),
+    ]
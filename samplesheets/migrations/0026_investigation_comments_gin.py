@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-15 09:26
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('samplesheets', '0025_genericmaterial_alt_names_gin'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='investigation',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['comments'], name='investigation_comments_gin'),
+        ),
+    ]
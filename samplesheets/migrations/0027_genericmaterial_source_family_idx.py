@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-15 09:41
+
+from django.db import migrations, models
+import django.db.models.fields.json
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('samplesheets', '0026_investigation_comments_gin'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genericmaterial',
+            index=models.Index(django.db.models.fields.json.KeyTransform('value', django.db.models.fields.json.KeyTransform('Family', 'characteristics')), condition=models.Q(('item_type', 'SOURCE')), name='material_source_family_idx'),
+        ),
+    ]
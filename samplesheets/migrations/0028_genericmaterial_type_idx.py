@@ -0,0 +1,21 @@
+# Generated by Django 3.2.25 on 2026-10-15 09:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('samplesheets', '0027_genericmaterial_source_family_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genericmaterial',
+            index=models.Index(fields=['study', 'item_type'], name='material_study_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='genericmaterial',
+            index=models.Index(fields=['assay', 'item_type'], name='material_assay_type_idx'),
+        ),
+    ]
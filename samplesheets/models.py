@@ -2,19 +2,23 @@
 
 import logging
 import os
-import uuid
 
 from altamisa.constants import table_headers as th
 
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.fields.json import KeyTransform
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.timezone import localtime
 
+# Local helper for generating UUIDs
+from sodar.utils import get_uuid7
+
 # Projectroles dependency
 from projectroles.models import Project
 from projectroles.plugins import get_backend_api
@@ -24,7 +28,6 @@ from samplesheets.utils import (
     get_comment,
     get_config_name,
     get_isa_field_name,
-    ALT_NAMES_COUNT,
 )
 
 
@@ -86,7 +89,7 @@ class BaseSampleSheet(models.Model):
 
     #: Internal UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     #: Data sharing rules
@@ -112,29 +115,41 @@ class BaseSampleSheet(models.Model):
     class Meta:
         abstract = True
 
+    def save(self, *args, **kwargs):
+        """Override save() to clear cached parent objects"""
+        self._clear_parent_cache()
+        super().save(*args, **kwargs)
+
+    def refresh_from_db(self, *args, **kwargs):
+        """Override refresh_from_db() to clear cached parent objects"""
+        self._clear_parent_cache()
+        super().refresh_from_db(*args, **kwargs)
+
+    def _clear_parent_cache(self):
+        """Clear parent objects cached by get_study() and get_project()"""
+        self.__dict__.pop('_cached_study', None)
+        self.__dict__.pop('_cached_project', None)
+
+    def _get_study(self):
+        """Return associated study, implemented in subclasses"""
+        return None
+
+    def _get_project(self):
+        """Return associated project, implemented in subclasses"""
+        return None
+
     # Custom row-level functions
     def get_study(self):
-        """Return associated study if it exists"""
-        if hasattr(self, 'assay') and self.assay:
-            return self.assay.study
-        elif hasattr(self, 'study') and self.study:
-            return self.study
-        elif type(self) == Study:
-            return self
+        """Return associated study if it exists. Cached until saved."""
+        if '_cached_study' not in self.__dict__:
+            self._cached_study = self._get_study()
+        return self._cached_study
 
     def get_project(self):
-        """Return associated project"""
-        if type(self) == Investigation:
-            return self.project
-        elif type(self) == Study:
-            return self.investigation.project
-        elif type(self) == Protocol:
-            return self.study.investigation.project
-        elif type(self) in [Assay, GenericMaterial, Process]:
-            if self.study:
-                return self.study.investigation.project
-            elif self.assay:
-                return self.assay.study.investigation.project
+        """Return associated project. Cached until saved."""
+        if '_cached_project' not in self.__dict__:
+            self._cached_project = self._get_project()
+        return self._cached_project
 
 
 # Investigation ----------------------------------------------------------------
@@ -248,12 +263,22 @@ class Investigation(BaseSampleSheet):
         help_text='File name of the original archive if imported',
     )
 
+    class Meta:
+        indexes = [
+            # Speed up active investigation lookups for a project
+            models.Index(fields=['project', 'active']),
+            # Speed up comment key lookups, e.g. for configuration
+            GinIndex(fields=['comments'], name='investigation_comments_gin'),
+        ]
+
     def __str__(self):
-        return '{}: {}'.format(self.project.title, self.title)
+        return f'{self.project.title}: {self.title}'
 
     def __repr__(self):
-        values = (self.project.title, self.title)
-        return 'Investigation({})'.format(', '.join(repr(v) for v in values))
+        return f'Investigation({self.project.title!r}, {self.title!r})'
+
+    def _get_project(self):
+        return self.project
 
     # Custom row-level functions
 
@@ -265,7 +290,6 @@ class Investigation(BaseSampleSheet):
 
     def get_configuration(self):
         """Return used configuration as string if found"""
-        # TODO: Do this with a nice regex instead, too tired now
         if CONFIG_LABEL_CREATE not in self.comments:
             return None
         return get_config_name(get_comment(self, CONFIG_LABEL_CREATE))
@@ -277,6 +301,24 @@ class Investigation(BaseSampleSheet):
             Q(study__investigation=self) | Q(assay__study__investigation=self),
         ).count()
 
+    def get_material_counts(self):
+        """
+        Return material counts for all types within the investigation in a
+        single query.
+
+        :return: Dict of item type and count (types without materials are
+                 omitted)
+        """
+        return dict(
+            GenericMaterial.objects.filter(
+                Q(study__investigation=self)
+                | Q(assay__study__investigation=self)
+            )
+            .order_by()
+            .values_list('item_type')
+            .annotate(count=Count('pk'))
+        )
+
     def get_url(self):
         """Return the URL for this investigation"""
         return reverse(
@@ -366,11 +408,16 @@ class Study(BaseSampleSheet):
         verbose_name_plural = 'studies'
 
     def __str__(self):
-        return '{}: {}'.format(self.get_project().title, self.get_name())
+        return f'{self.get_project().title}: {self.get_name()}'
 
     def __repr__(self):
-        values = (self.get_project().title, self.get_name())
-        return 'Study({})'.format(', '.join(repr(v) for v in values))
+        return f'Study({self.get_project().title!r}, {self.get_name()!r})'
+
+    def _get_study(self):
+        return self
+
+    def _get_project(self):
+        return self.investigation.project
 
     # Custom row-level functions
 
@@ -392,6 +439,22 @@ class Study(BaseSampleSheet):
             .prefetch_related('protocol')
         )
 
+    def get_graph_nodes(self):
+        """
+        Return list of all nodes for study as named tuples containing only the
+        fields required for building the node graph, in the same order as
+        get_nodes(). Avoids instantiating full model objects.
+        """
+        return list(
+            GenericMaterial.objects.filter(study=self)
+            .order_by('pk')
+            .values_list('unique_name', 'item_type', named=True)
+        ) + list(
+            Process.objects.filter(study=self)
+            .order_by('pk')
+            .values_list('unique_name', named=True)
+        )
+
     def get_sources(self):
         """Return sources used in study"""
         # TODO: Add tests
@@ -403,8 +466,9 @@ class Study(BaseSampleSheet):
         """Return active study app plugin or None if not found"""
         from samplesheets.plugins import SampleSheetStudyPluginPoint
 
+        config_name = self.investigation.get_configuration()
         for plugin in SampleSheetStudyPluginPoint.get_plugins():
-            if plugin.config_name == self.investigation.get_configuration():
+            if plugin.config_name == config_name:
                 return plugin
 
     def get_url(self):
@@ -467,13 +531,20 @@ class Protocol(BaseSampleSheet):
         unique_together = ('study', 'name')
 
     def __str__(self):
-        return '{}: {}/{}'.format(
-            self.get_project().title, self.study.get_name(), self.name
-        )
+        project_title = self.get_project().title
+        return f'{project_title}: {self.study.get_name()}/{self.name}'
 
     def __repr__(self):
-        values = (self.get_project().title, self.study.get_name(), self.name)
-        return 'Protocol({})'.format(', '.join(repr(v) for v in values))
+        return (
+            f'Protocol({self.get_project().title!r}, '
+            f'{self.study.get_name()!r}, {self.name!r})'
+        )
+
+    def _get_study(self):
+        return self.study
+
+    def _get_project(self):
+        return self.study.investigation.project
 
 
 # Assay ------------------------------------------------------------------------
@@ -529,23 +600,27 @@ class Assay(BaseSampleSheet):
         ordering = ['study__file_name', 'file_name']
 
     def __str__(self):
-        return '{}: {}/{}'.format(
-            self.get_project().title, self.study.get_name(), self.get_name()
-        )
+        project_title = self.get_project().title
+        return f'{project_title}: {self.study.get_name()}/{self.get_name()}'
 
     def __repr__(self):
-        values = (
-            self.get_project().title,
-            self.study.get_name(),
-            self.get_name(),
+        return (
+            f'Assay({self.get_project().title!r}, '
+            f'{self.study.get_name()!r}, {self.get_name()!r})'
         )
-        return 'Assay({})'.format(', '.join(repr(v) for v in values))
+
+    def _get_study(self):
+        return self.study
+
+    def _get_project(self):
+        return self.study.investigation.project
 
     # Custom row-level functions
 
     def get_name(self):
         """Return simple idenfitying name for assay"""
-        return ''.join(str(self.file_name)[2:].split('.')[:-1])
+        # Strip prefix and extension, remove any remaining dots
+        return str(self.file_name)[2:].rpartition('.')[0].replace('.', '')
 
     def get_display_name(self):
         """Return display name for assay"""
@@ -557,15 +632,14 @@ class Assay(BaseSampleSheet):
         from samplesheets.plugins import SampleSheetAssayPluginPoint
 
         # Check override in assay comments
-        if self.comments.get(ISA_META_ASSAY_PLUGIN):
+        plugin_name = self.comments.get(ISA_META_ASSAY_PLUGIN)
+        if plugin_name:
             try:
-                return SampleSheetAssayPluginPoint.get_plugin(
-                    self.comments[ISA_META_ASSAY_PLUGIN]
-                )
+                return SampleSheetAssayPluginPoint.get_plugin(plugin_name)
             except Exception as ex:
                 logger.error(
                     'Exception raised retrieving assay plugin with name '
-                    '"{}": {}'.format(self.comments[ISA_META_ASSAY_PLUGIN], ex)
+                    '"{}": {}'.format(plugin_name, ex)
                 )
 
         # If not found, select by measurement/technology type
@@ -594,6 +668,18 @@ class NodeMixin:
     TODO: Eventually should go into a node base class (see issue #922)
     """
 
+    def _get_study(self):
+        if self.assay:
+            return self.assay.study
+        return self.study
+
+    def _get_project(self):
+        if self.study:
+            return self.study.investigation.project
+        elif self.assay:
+            return self.assay.study.investigation.project
+        return None
+
     def get_header_idx(self, header_name, header_type=None):
         """
         Return index of a header in headers.
@@ -686,16 +772,11 @@ class GenericMaterialManager(models.Manager):
             if not isinstance(item_types, list):
                 item_types = [item_types]
             objects = objects.filter(item_type__in=item_types)
-        # HACK for ArrayField
         # NOTE: Only look for alt_names as they also contain lowercase name
-        # TODO: Why not just use iexact?
-        term_query = Q()
-        for i in range(0, ALT_NAMES_COUNT):
-            for t in search_terms:
-                term_query.add(
-                    Q(**{'alt_names__{}'.format(i): t.lower()}), Q.OR
-                )
-        return objects.filter(term_query).order_by('name')
+        # NOTE: Overlap (&&) on the array can use the GIN index on alt_names
+        return objects.filter(
+            alt_names__overlap=[t.lower() for t in search_terms]
+        ).order_by('name')
 
 
 class GenericMaterial(NodeMixin, BaseSampleSheet):
@@ -734,7 +815,6 @@ class GenericMaterial(NodeMixin, BaseSampleSheet):
     alt_names = ArrayField(
         models.CharField(max_length=DEFAULT_LENGTH, blank=True),
         default=list,
-        db_index=True,
         help_text='Alternative names',
     )
 
@@ -798,26 +878,40 @@ class GenericMaterial(NodeMixin, BaseSampleSheet):
         ordering = ['name']
         verbose_name = 'material'
         verbose_name_plural = 'materials'
-        indexes = [models.Index(fields=['unique_name'])]
+        indexes = [
+            models.Index(fields=['unique_name']),
+            GinIndex(fields=['alt_names'], name='material_alt_names_gin'),
+            # For source lookups by family (germline study app)
+            models.Index(
+                KeyTransform(
+                    'value', KeyTransform('Family', 'characteristics')
+                ),
+                condition=Q(item_type='SOURCE'),
+                name='material_source_family_idx',
+            ),
+            # For material queries filtered by study or assay and item type
+            models.Index(
+                fields=['study', 'item_type'], name='material_study_type_idx'
+            ),
+            models.Index(
+                fields=['assay', 'item_type'], name='material_assay_type_idx'
+            ),
+        ]
 
     def __str__(self):
-        return '{}: {}/{}/{}/{}'.format(
-            self.get_project().title,
-            self.get_study().title,
-            self.assay.get_name() if self.assay else NOT_AVAILABLE_STR,
-            self.item_type,
-            self.unique_name,
+        assay_name = self.assay.get_name() if self.assay else NOT_AVAILABLE_STR
+        return (
+            f'{self.get_project().title}: {self.get_study().title}/'
+            f'{assay_name}/{self.item_type}/{self.unique_name}'
         )
 
     def __repr__(self):
-        values = (
-            self.get_project().title,
-            self.get_study().title,
-            self.assay.get_name() if self.assay else NOT_AVAILABLE_STR,
-            self.item_type,
-            self.unique_name,
+        assay_name = self.assay.get_name() if self.assay else NOT_AVAILABLE_STR
+        return (
+            f'GenericMaterial({self.get_project().title!r}, '
+            f'{self.get_study().title!r}, {assay_name!r}, '
+            f'{self.item_type!r}, {self.unique_name!r})'
         )
-        return 'GenericMaterial({})'.format(', '.join(repr(v) for v in values))
 
     # Saving and validation
 
@@ -831,7 +925,8 @@ class GenericMaterial(NodeMixin, BaseSampleSheet):
 
     def _validate_parent(self):
         """Validate the existence of a parent assay or study"""
-        if not self.get_parent():
+        # NOTE: Check foreign keys directly to avoid querying parent objects
+        if not self.assay_id and not self.study_id:
             raise ValidationError('Parent assay or study not set')
 
     def _validate_item_fields(self):
@@ -857,12 +952,17 @@ class GenericMaterial(NodeMixin, BaseSampleSheet):
     def get_sample_assays(self):
         """
         If the material is a SAMPLE, return assays where it is used, else None.
+        The arcs field is deferred as it is only needed for filtering.
         """
         if self.item_type != 'SAMPLE':
             return None
-        return Assay.objects.filter(
-            study=self.study, arcs__contains=[self.unique_name]
-        ).order_by('file_name')
+        return (
+            Assay.objects.filter(
+                study=self.study, arcs__contains=[self.unique_name]
+            )
+            .defer('arcs')
+            .order_by('file_name')
+        )
 
 
 # Process ----------------------------------------------------------------------
@@ -969,21 +1069,19 @@ class Process(NodeMixin, BaseSampleSheet):
         indexes = [models.Index(fields=['unique_name'])]
 
     def __str__(self):
-        return '{}: {}/{}/{}'.format(
-            self.get_project().title,
-            self.get_study().get_name(),
-            self.assay.get_name() if self.assay else NOT_AVAILABLE_STR,
-            self.unique_name,
+        assay_name = self.assay.get_name() if self.assay else NOT_AVAILABLE_STR
+        return (
+            f'{self.get_project().title}: {self.get_study().get_name()}/'
+            f'{assay_name}/{self.unique_name}'
         )
 
     def __repr__(self):
-        values = (
-            self.get_project().title,
-            self.get_study().get_name(),
-            self.assay.get_name() if self.assay else NOT_AVAILABLE_STR,
-            self.unique_name,
+        assay_name = self.assay.get_name() if self.assay else NOT_AVAILABLE_STR
+        return (
+            f'Process({self.get_project().title!r}, '
+            f'{self.get_study().get_name()!r}, {assay_name!r}, '
+            f'{self.unique_name!r})'
         )
-        return 'Process({})'.format(', '.join(repr(v) for v in values))
 
     # Saving and validation
 
@@ -994,7 +1092,8 @@ class Process(NodeMixin, BaseSampleSheet):
 
     def _validate_parent(self):
         """Validate the existence of a parent assay or study"""
-        if not self.get_parent():
+        # NOTE: Check foreign keys directly to avoid querying parent objects
+        if not self.assay_id and not self.study_id:
             raise ValidationError('Parent assay or study not set')
 
     # Custom row-level functions
@@ -1010,6 +1109,25 @@ class Process(NodeMixin, BaseSampleSheet):
 # ISA-Tab File Saving ----------------------------------------------------------
 
 
+class ISATabManager(models.Manager):
+    """Manager for custom table-level ISATab queries"""
+
+    def with_investigation_title(self):
+        """
+        Return ISATab objects annotated with the title of their investigation
+        for get_full_name(), to avoid a query per object when listing versions.
+
+        :return: QuerySet
+        """
+        return self.get_queryset().annotate(
+            investigation_title=Subquery(
+                Investigation.objects.filter(
+                    sodar_uuid=OuterRef('investigation_uuid')
+                ).values('title')[:1]
+            )
+        )
+
+
 class ISATab(models.Model):
     """
     Class for storing ISA-Tab files for one investigation, including its
@@ -1090,17 +1208,22 @@ class ISATab(models.Model):
 
     #: Internal UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
+    # Set manager for custom queries
+    objects = ISATabManager()
+
     def __str__(self):
-        return '{}: {} ({})'.format(
-            self.project.title, self.archive_name, self.date_created
+        return (
+            f'{self.project.title}: {self.archive_name} ({self.date_created})'
         )
 
     def __repr__(self):
-        values = (self.project.title, self.archive_name, self.date_created)
-        return 'ISATab({})'.format(', '.join(repr(v) for v in values))
+        return (
+            f'ISATab({self.project.title!r}, {self.archive_name!r}, '
+            f'{self.date_created!r})'
+        )
 
     # Custom row-level functions
 
@@ -1110,11 +1233,17 @@ class ISATab(models.Model):
 
     def get_full_name(self):
         """Return full name with investigation title or archive name"""
-        investigation = Investigation.objects.filter(
-            sodar_uuid=self.investigation_uuid
-        ).first()
-        if investigation and investigation.title:
-            name = investigation.title
+        # Use title annotated by ISATabManager.with_investigation_title()
+        if 'investigation_title' in self.__dict__:
+            inv_title = self.investigation_title
+        else:
+            inv_title = (
+                Investigation.objects.filter(sodar_uuid=self.investigation_uuid)
+                .values_list('title', flat=True)
+                .first()
+            )
+        if inv_title:
+            name = inv_title
         elif self.archive_name:
             name = self.archive_name.split('.')[0]
         else:
@@ -1197,7 +1326,7 @@ class IrodsAccessTicket(models.Model):
 
     #: SODAR UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     #: Standard manager
@@ -1210,22 +1339,17 @@ class IrodsAccessTicket(models.Model):
         ordering = ['-date_created']
 
     def __str__(self):
-        return '{} / {} / {} / {}'.format(
-            self.study.investigation.project.title,
-            self.assay.get_display_name(),
-            self.get_coll_name(),
-            self.get_label(),
+        return (
+            f'{self.study.investigation.project.title} / '
+            f'{self.assay.get_display_name()} / {self.get_coll_name()} / '
+            f'{self.get_label()}'
         )
 
     def __repr__(self):
-        values = (
-            self.study.investigation.project.title,
-            self.assay.get_display_name(),
-            self.get_coll_name(),
-            self.get_label(),
-        )
-        return 'IrodsAccessTicket({})'.format(
-            ', '.join(repr(v) for v in values)
+        return (
+            f'IrodsAccessTicket({self.study.investigation.project.title!r}, '
+            f'{self.assay.get_display_name()!r}, {self.get_coll_name()!r}, '
+            f'{self.get_label()!r})'
         )
 
     def get_project(self):
@@ -1251,12 +1375,13 @@ class IrodsAccessTicket(models.Model):
 
     def get_display_name(self):
         assay_name = ''
-        if (
-            Assay.objects.filter(
+        # NOTE: Assay count may be annotated in queryset to avoid a query
+        assay_count = getattr(self, 'project_assay_count', None)
+        if assay_count is None:
+            assay_count = Assay.objects.filter(
                 study__investigation__project=self.study.investigation.project
             ).count()
-            > 1
-        ):
+        if assay_count > 1:
             assay_name = '{} / '.format(self.assay.get_display_name())
         return '{}{} / {}'.format(
             assay_name, self.get_coll_name(), self.get_label()
@@ -1353,23 +1478,18 @@ class IrodsDataRequest(models.Model):
 
     #: Internal UUID for the object
     sodar_uuid = models.UUIDField(
-        default=uuid.uuid4, unique=True, help_text='SODAR UUID for the object'
+        default=get_uuid7, unique=True, help_text='SODAR UUID for the object'
     )
 
     def __str__(self):
-        return '{}: {} {}'.format(
-            self.project.title, self.action, self.get_short_path()
-        )
+        return f'{self.project.title}: {self.action} {self.get_short_path()}'
 
     def __repr__(self):
-        values = (
-            self.project.title,
-            self.get_assay_name(),
-            self.action,
-            self.path,
-            self.user.username,
+        return (
+            f'IrodsDataRequest({self.project.title!r}, '
+            f'{self.get_assay_name()!r}, {self.action!r}, {self.path!r}, '
+            f'{self.user.username!r})'
         )
-        return 'IrodsDataRequest({})'.format(', '.join(repr(v) for v in values))
 
     # Saving and validation
 
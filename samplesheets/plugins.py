@@ -35,10 +35,11 @@ from samplesheets.models import (
     ISA_META_ASSAY_PLUGIN,
 )
 from samplesheets.rendering import SampleSheetTableBuilder
-from samplesheets.urls import urlpatterns
+from samplesheets.urls import urls_ui, urls_api, urls_ajax
 from samplesheets.utils import (
     get_isa_field_name,
     get_sheets_url,
+    get_top_headers,
 )
 from samplesheets.views import (
     IrodsCollsCreateViewMixin,
@@ -87,6 +88,18 @@ SYNC_URL_RE = (
     r'/samplesheets/sync/[a-f0-9]{8}-?[a-f0-9]{4}-?4[a-f0-9]{3}-?[89ab][a-f0-9]'
     r'{3}-?[a-f0-9]{12}'
 )
+# Models supported in get_object_link()
+LINK_MODELS = {
+    m.__name__: m
+    for m in [
+        Investigation,
+        Study,
+        Assay,
+        ISATab,
+        IrodsAccessTicket,
+        IrodsDataRequest,
+    ]
+}
 
 
 # Samplesheets project app plugin ----------------------------------------------
@@ -106,7 +119,7 @@ class ProjectAppPlugin(
     title = 'Sample Sheets'
 
     #: App URLs (will be included in settings by djangoplugins)
-    urls = urlpatterns
+    urls = urls_ui + urls_api + urls_ajax
 
     #: App settings definition
     app_settings = {
@@ -307,7 +320,10 @@ class ProjectAppPlugin(
         :param uuid: sodar_uuid of the referred object
         :return: Dict or None if not found
         """
-        obj = self.get_object(eval(model_str), uuid)
+        model = LINK_MODELS.get(model_str)
+        if not model:
+            return None
+        obj = self.get_object(model, uuid)
         if not obj:
             return None
         if obj.__class__ == IrodsAccessTicket:
@@ -347,22 +363,29 @@ class ProjectAppPlugin(
         ret = []
         materials = GenericMaterial.objects.find(
             search_terms, keywords, item_types=item_types
-        )
+        ).select_related('study__investigation__project', 'assay')
+        perms = {}  # Permission check results by project ID
         for m in materials:
-            if user.has_perm('samplesheets.view_sheet', m.get_project()):
-                if m.item_type == 'SAMPLE':
-                    assays = m.get_sample_assays()
-                else:
-                    assays = [m.assay]
-                ret.append(
-                    {
-                        'name': m.name,
-                        'type': m.item_type,
-                        'project': m.get_project(),
-                        'study': m.study,
-                        'assays': assays,
-                    }
+            project = m.get_project()
+            if project.pk not in perms:
+                perms[project.pk] = user.has_perm(
+                    'samplesheets.view_sheet', project
                 )
+            if not perms[project.pk]:
+                continue
+            if m.item_type == 'SAMPLE':
+                assays = m.get_sample_assays()
+            else:
+                assays = [m.assay]
+            ret.append(
+                {
+                    'name': m.name,
+                    'type': m.item_type,
+                    'project': project,
+                    'study': m.study,
+                    'assays': assays,
+                }
+            )
         return ret
 
     @classmethod
@@ -386,15 +409,18 @@ class ProjectAppPlugin(
             for p in Project.objects.filter(type=PROJECT_TYPE_PROJECT)
             if user.has_perm('samplesheets.view_sheet', p)
         }
+        # NOTE: Arcs are not needed for search results, skip loading them
         studies = {
             str(s.sodar_uuid): s
             for s in Study.objects.filter(
                 investigation__project__in=projects.values()
-            )
+            ).defer('arcs')
         }
         assays = {
             str(a.sodar_uuid): a
-            for a in Assay.objects.filter(study__in=studies.values())
+            for a in Assay.objects.filter(study__in=studies.values()).defer(
+                'arcs'
+            )
         }
 
         for o in obj_list:
@@ -951,7 +977,19 @@ class SampleSheetAssayPluginPoint(PluginPoint):
         # TODO: Implement this in your assay plugin if display_row_links=True
         return None
 
-    def update_row(self, row, table, assay, index):
+    def get_table_context(self, table, assay):
+        """
+        Return data needed by update_row() for all rows of an assay table. This
+        is called once per table and the result is passed to update_row() as
+        table_ctx. By default, returns top headers by column index.
+
+        :param table: Full table (dict)
+        :param assay: Assay object
+        :return: Object to be passed to update_row()
+        """
+        return get_top_headers(table)
+
+    def update_row(self, row, table, assay, index, table_ctx=None):
         """
         Update render table row with e.g. links. Return the modified row.
 
@@ -959,6 +997,7 @@ class SampleSheetAssayPluginPoint(PluginPoint):
         :param table: Full table (list of lists)
         :param assay: Assay object
         :param index: Row index (int)
+        :param table_ctx: Return data of get_table_context() (optional)
         :return: List of dicts
         """
         # TODO: Implement this in your assay plugin
@@ -1145,6 +1184,7 @@ def get_irods_content(inv, study, irods_backend, ret_data):
                 app_name=assay_plugin.app_name,
                 project=assay.get_project(),
             )
+            table_ctx = assay_plugin.get_table_context(a_data, assay)
 
             for idx, row in enumerate(a_data['table_data']):
                 # Update assay links column
@@ -1164,7 +1204,9 @@ def get_irods_content(inv, study, irods_backend, ret_data):
                     enabled = False
                 a_data['irods_paths'].append({'path': path, 'enabled': enabled})
                 # Update row links
-                assay_plugin.update_row(row, a_data, assay, idx)
+                assay_plugin.update_row(
+                    row, a_data, assay, idx, table_ctx=table_ctx
+                )
 
             # Add visual notification to all shortcuts coming from assay plugin
             assay_shortcuts = assay_plugin.get_shortcuts(assay) or []
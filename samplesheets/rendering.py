@@ -7,12 +7,14 @@ import re
 import time
 
 from datetime import date
+from uuid import uuid4
 from packaging import version
 
 from altamisa.constants import table_headers as th
 from altamisa.isatab.write_assay_study import RefTableBuilder
 
 from django.conf import settings
+from django.core.cache import cache
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
@@ -75,6 +77,8 @@ HEADER_MAP = {
     th.PERFORMER: 'Performer',
     th.DATE: 'Perform Date',
 }
+# Column type lookup by lowercase header name
+HEADER_COL_TYPES = {'protocol': 'PROTOCOL', 'external links': 'EXTERNAL_LINKS'}
 # Map JSON attributes to model attributes
 MODEL_JSON_ATTRS = [
     'characteristics',
@@ -83,12 +87,42 @@ MODEL_JSON_ATTRS = [
     'parameter_values',
 ]
 STUDY_TABLE_CACHE_ITEM = 'sheet/tables/study/{study}'
+STUDY_TABLE_MEM_CACHE_KEY = 'samplesheets:tables:study:{study}:{version}'
+STUDY_TABLE_MEM_CACHE_VERSION_KEY = 'samplesheets:tables:study:{study}:version'
 SIMPLE_LINK_TEMPLATE = '{label} <{url}>'
 
 
 # Table building ---------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=1024)
+def get_list_header(header):
+    """
+    Return type and name of a value list header, e.g. "Characteristics[x]".
+    Cached as the same headers are parsed for each node on each row.
+
+    :param header: Header string
+    :return: Tuple of strings or None if not a list header
+    """
+    m = header_re.match(header)
+    return m.groups() if m else None
+
+
+@functools.lru_cache(maxsize=4096)
+def get_text_length(value):
+    """
+    Return estimated display length for a proportional text string. Cached as
+    the same values tend to repeat on each row of a column.
+
+    :param value: String
+    :return: Integer
+    """
+    # Very unscientific and font-specific, don't try this at home
+    nc = sum([value.count(c) for c in NARROW_CHARS])
+    wc = sum([value.count(c) for c in WIDE_CHARS])
+    return round(len(value) - nc - wc + 0.6 * nc + 1.3 * wc)
+
+
 class SampleSheetRenderingException(Exception):
     """Sample sheet rendering exception"""
 
@@ -203,6 +237,7 @@ class SampleSheetTableBuilder:
             self._field_configs.append(False)
 
         # Column type (the ones we can determine at this point)
+        name_lower = name.lower()
         if (
             field_config
             and field_config.get('format') in ['double', 'integer']
@@ -212,18 +247,16 @@ class SampleSheetTableBuilder:
 
         # Else detect type without config
         elif (
-            name.lower() == 'name' or name in th.PROCESS_NAME_HEADERS
+            name_lower == 'name' or name in th.PROCESS_NAME_HEADERS
         ) and header['item_type'] != 'DATA':
             header['col_type'] = 'NAME'
-        elif name.lower() == 'protocol':
-            header['col_type'] = 'PROTOCOL'
-        elif 'contact' in name.lower() or name == 'Performer':
+        elif name_lower in HEADER_COL_TYPES:
+            header['col_type'] = HEADER_COL_TYPES[name_lower]
+        elif 'contact' in name_lower or name == 'Performer':
             header['col_type'] = 'CONTACT'
         elif name == 'Perform Date':
             header['col_type'] = 'DATE'
-        elif name.lower() == 'external links':
-            header['col_type'] = 'EXTERNAL_LINKS'
-        elif name.lower() == 'name' and header['item_type'] == 'DATA':
+        elif name_lower == 'name' and header['item_type'] == 'DATA':
             header['col_type'] = 'LINK_FILE'
         # Recognize ONTOLOGY by headers
         elif obj.is_ontology_field(name, header_type):
@@ -306,11 +339,10 @@ class SampleSheetTableBuilder:
         headers = [h for h in obj.headers if h not in IGNORED_HEADERS]
 
         for h in headers:
-            list_ref = re.findall(header_re, h)
+            list_ref = get_list_header(h)
             # Value lists with possible ontology annotation
             if list_ref:
-                h_type = list_ref[0][0]
-                h_name = list_ref[0][1]
+                h_type, h_name = list_ref
                 if h_type in LIST_ATTR_MAP and hasattr(
                     obj, LIST_ATTR_MAP[h_type]
                 ):
@@ -476,11 +508,7 @@ class SampleSheetTableBuilder:
                 link_groups = re.findall(link_re, value)
                 if link_groups:
                     value = link_groups[0][0]
-
-            # Very unscientific and font-specific, don't try this at home
-            nc = sum([value.count(c) for c in NARROW_CHARS])
-            wc = sum([value.count(c) for c in WIDE_CHARS])
-            return round(len(value) - nc - wc + 0.6 * nc + 1.3 * wc)
+            return get_text_length(value)
 
         def _is_num(value):
             """Return whether a value contains an integer/double"""
@@ -492,10 +520,25 @@ class SampleSheetTableBuilder:
             except (ValueError, TypeError):
                 return False
 
+        def _is_num_col(values):
+            """
+            Return whether values contain at least one number and are otherwise
+            numeric or empty, evaluated in a single pass.
+            """
+            found = False
+            for v in values:
+                if _is_num(v):
+                    found = True
+                elif v:
+                    return False
+            return found
+
+        table_data = self._table_data
         top_idx = 0  # Top header index
         grp_idx = 0  # Index within current top header group
-        for i in range(len(self._field_header)):
-            header_name = self._field_header[i]['value']
+        for i, field_header in enumerate(self._field_header):
+            cells = [x[i] for x in table_data]
+            header_name = field_header['value']
             # Set column type to NUMERIC if values are all numeric or empty
             # (except if name or process name)
             # Skip check if column is already defined as UNIT
@@ -503,19 +546,13 @@ class SampleSheetTableBuilder:
                 header_name != 'Name'
                 and header_name not in th.PROCESS_NAME_HEADERS
                 and not self._field_configs[i]
-                and self._field_header[i]['col_type'] not in ['NUMERIC', 'UNIT']
-                and any(_is_num(x[i]['value']) for x in self._table_data)
-                and all(
-                    (_is_num(x[i]['value']) or not x[i]['value'])
-                    for x in self._table_data
-                )
+                and field_header['col_type'] not in ['NUMERIC', 'UNIT']
+                and _is_num_col([c['value'] for c in cells])
             ):
-                self._field_header[i]['col_type'] = 'NUMERIC'
+                field_header['col_type'] = 'NUMERIC'
 
             # Maximum column value length for column width estimate
-            field_header_len = round(
-                _get_length(self._field_header[i]['value'])
-            )
+            field_header_len = round(_get_length(header_name))
             # If there is only one column in top header, use top header length
             if self._top_header[top_idx]['colspan'] == 1:
                 top_header_len = round(
@@ -525,47 +562,39 @@ class SampleSheetTableBuilder:
             else:
                 header_len = field_header_len
 
-            col_type = self._field_header[i]['col_type']
+            col_type = field_header['col_type']
             if col_type == 'CONTACT':
-                max_cell_len = max(
-                    [
-                        (
-                            _get_length(
-                                re.findall(link_re, x[i]['value'])[0][0]
-                            )
-                            if re.findall(link_re, x[i].get('value'))
-                            else len(x[i].get('value') or '')
-                        )
-                        for x in self._table_data
-                    ]
-                )
+                max_cell_len = 0
+                for c in cells:
+                    link_groups = re.findall(link_re, c.get('value'))
+                    cell_len = (
+                        _get_length(link_groups[0][0])
+                        if link_groups
+                        else len(c.get('value') or '')
+                    )
+                    max_cell_len = max(max_cell_len, cell_len)
             elif col_type == 'EXTERNAL_LINKS':  # Special case, count elements
                 header_len = 0  # Header length is not comparable
                 max_cell_len = max(
                     [
                         (
-                            len(x[i]['value'])
-                            if (
-                                x[i]['value']
-                                and isinstance(x[i]['value'], list)
-                            )
+                            len(c['value'])
+                            if (c['value'] and isinstance(c['value'], list))
                             else 0
                         )
-                        for x in self._table_data
+                        for c in cells
                     ]
                 )
             else:  # Generic type
                 max_cell_len = max(
                     [
-                        _get_length(x[i]['value'], col_type)
-                        + _get_length(x[i].get('unit'), col_type)
+                        _get_length(c['value'], col_type)
+                        + _get_length(c.get('unit'), col_type)
                         + 1
-                        for x in self._table_data
+                        for c in cells
                     ]
                 )
-            self._field_header[i]['max_value_len'] = max(
-                [header_len, max_cell_len]
-            )
+            field_header['max_value_len'] = max([header_len, max_cell_len])
 
             if grp_idx == self._top_header[top_idx]['colspan'] - 1:
                 top_idx += 1
@@ -628,14 +657,18 @@ class SampleSheetTableBuilder:
         Get study reference table for building final table data.
 
         :param study: Study object
-        :param nodes: Study nodes (optional)
+        :param nodes: Study nodes (optional, graph nodes are retrieved if not
+                      set)
         :return: Nodes (list), table (list)
         """
         if not nodes:
-            nodes = study.get_nodes()
-        arcs = study.arcs
-        for a in study.assays.all().order_by('file_name'):
-            arcs += a.arcs
+            nodes = study.get_graph_nodes()
+        # NOTE: Copy to avoid modifying study arcs in place
+        arcs = list(study.arcs)
+        for a_arcs in study.assays.order_by('file_name').values_list(
+            'arcs', flat=True
+        ):
+            arcs += a_arcs
 
         def _is_of_starting_type(starting_type, v):
             """Predicate to select vertices based on starting type."""
@@ -721,7 +754,7 @@ class SampleSheetTableBuilder:
         ret = {'studies': []}
         for study in investigation.studies.all().order_by('pk'):
             study_data = {'headers': [], 'assays': []}
-            all_refs = self.build_study_reference(study, study.get_nodes())
+            all_refs = self.build_study_reference(study)
             sample_idx = self.get_sample_idx(all_refs)
             study_refs = self.get_study_refs(all_refs, sample_idx)
             assay_id = 0
@@ -850,6 +883,16 @@ class SampleSheetTableBuilder:
                 study.get_name(), study.sodar_uuid
             )
         )
+        mem_version = None
+        if settings.SHEETS_ENABLE_STUDY_TABLE_CACHE:
+            # Get tables from memory cache to skip database and JSON decoding
+            # NOTE: Version is retrieved first so tables read or built here are
+            #       not cached if clear_study_cache() is called meanwhile
+            mem_version = self._get_mem_cache_version(study)
+            study_tables = self._get_mem_cache(study, mem_version)
+            if study_tables:
+                logger.debug('Returning study tables from memory cache')
+                return study_tables
         cache_backend = get_backend_api('sodar_cache')
         item_name = STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid)
         project = study.get_project()
@@ -863,6 +906,7 @@ class SampleSheetTableBuilder:
                 )
                 if item and item.data:
                     logger.debug('Returning cached study tables')
+                    self.set_mem_cache(study, item.data, mem_version)
                     return item.data
                 logger.debug('Cache item "{}" not set'.format(item_name))
         else:
@@ -885,17 +929,86 @@ class SampleSheetTableBuilder:
                 logger.error(
                     'Failed to set cache item "{}": {}'.format(item_name, ex)
                 )
+        if settings.SHEETS_ENABLE_STUDY_TABLE_CACHE:
+            self.set_mem_cache(study, study_tables, mem_version)
         return study_tables
 
+    @classmethod
+    def _get_mem_cache_version(cls, study):
+        """
+        Return current version of study render tables in the Django cache, or
+        None if the memory cache is disabled. A new version is set if not
+        found, so entries stored before the version was lost are not used.
+
+        :param study: Study object
+        :return: String or None
+        """
+        if not settings.SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT:
+            return None
+        key = STUDY_TABLE_MEM_CACHE_VERSION_KEY.format(study=study.sodar_uuid)
+        version = cache.get(key)
+        if not version:
+            cache.add(key, uuid4().hex, None)
+            version = cache.get(key)
+        return version
+
+    @classmethod
+    def _get_mem_cache(cls, study, version):
+        """
+        Return study render tables from the Django cache, or None if not found
+        or if the memory cache is disabled.
+
+        :param study: Study object
+        :param version: Memory cache version (string or None)
+        :return: Dict or None
+        """
+        if not settings.SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT or not version:
+            return None
+        return cache.get(
+            STUDY_TABLE_MEM_CACHE_KEY.format(
+                study=study.sodar_uuid, version=version
+            )
+        )
+
+    @classmethod
+    def set_mem_cache(cls, study, study_tables, version=None):
+        """
+        Set study render tables in the Django cache. Must be called whenever
+        the sodarcache item for the study tables is updated elsewhere.
+
+        :param study: Study object
+        :param study_tables: Dict
+        :param version: Memory cache version retrieved before reading or
+                        building the tables (string, optional, defaults to
+                        current version)
+        """
+        if not settings.SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT:
+            return
+        if not version:
+            version = cls._get_mem_cache_version(study)
+        cache.set(
+            STUDY_TABLE_MEM_CACHE_KEY.format(
+                study=study.sodar_uuid, version=version
+            ),
+            study_tables,
+            settings.SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT,
+        )
+
     @classmethod
     def clear_study_cache(cls, study, delete=False):
         """
-        Clear study render table data from sodarcache, if cache is enabled and
-        cached tables exist.
+        Clear study render table data from the memory cache and sodarcache, if
+        cache is enabled and cached tables exist.
 
         :param study: Study object
         :param delete: Delete item instead of clearing value if true (bool)
         """
+        # Set new memory cache version, leaving existing entries to expire
+        cache.set(
+            STUDY_TABLE_MEM_CACHE_VERSION_KEY.format(study=study.sodar_uuid),
+            uuid4().hex,
+            None,
+        )
         cache_backend = get_backend_api('sodar_cache')
         if cache_backend:
             item_name = STUDY_TABLE_CACHE_ITEM.format(study=study.sodar_uuid)
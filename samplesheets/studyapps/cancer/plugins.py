@@ -7,10 +7,16 @@ from django.contrib import auth
 from django.urls import reverse
 
 # Projectroles dependency
-from projectroles.models import Project, SODAR_CONSTANTS
+from projectroles.models import SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 
-from samplesheets.models import Investigation, Study, Assay, GenericMaterial
+from samplesheets.models import (
+    Investigation,
+    Study,
+    Assay,
+    GenericMaterial,
+    CONFIG_LABEL_CREATE,
+)
 from samplesheets.plugins import SampleSheetStudyPluginPoint
 from samplesheets.rendering import SampleSheetTableBuilder
 from samplesheets.studyapps.cancer.utils import (
@@ -314,18 +320,17 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
         cache_backend = get_backend_api('sodar_cache')
         if not cache_backend:
             return
-        projects = (
-            [project]
-            if project
-            else Project.objects.filter(type=PROJECT_TYPE_PROJECT)
+        # Only investigations with a configuration comment can be applicable
+        investigations = Investigation.objects.filter(
+            active=True, comments__has_key=CONFIG_LABEL_CREATE
         )
-        for project in projects:
-            try:
-                investigation = Investigation.objects.get(
-                    project=project, active=True
-                )
-            except Investigation.DoesNotExist:
-                continue
+        if project:
+            investigations = investigations.filter(project=project)
+        else:
+            investigations = investigations.filter(
+                project__type=PROJECT_TYPE_PROJECT
+            )
+        for investigation in investigations:
             # Only apply for investigations with the correct configuration
             if investigation.get_configuration() != self.config_name:
                 continue
@@ -7,10 +7,15 @@ from django.contrib import auth
 from django.urls import reverse
 
 # Projectroles dependency
-from projectroles.models import Project, SODAR_CONSTANTS
+from projectroles.models import SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 
-from samplesheets.models import Investigation, Study, GenericMaterial
+from samplesheets.models import (
+    Investigation,
+    Study,
+    GenericMaterial,
+    CONFIG_LABEL_CREATE,
+)
 from samplesheets.plugins import SampleSheetStudyPluginPoint
 from samplesheets.rendering import SampleSheetTableBuilder
 from samplesheets.studyapps.germline.utils import (
@@ -411,24 +416,24 @@ class SampleSheetStudyPlugin(SampleSheetStudyPluginPoint):
             return
         cache_backend = get_backend_api('sodar_cache')
         irods_backend = get_backend_api('omics_irods')
-        projects = (
-            [project]
-            if project
-            else Project.objects.filter(type=PROJECT_TYPE_PROJECT)
-        )
+        # Only investigations with a configuration comment can be applicable
+        investigations = Investigation.objects.filter(
+            active=True, comments__has_key=CONFIG_LABEL_CREATE
+        ).select_related('project')
+        if project:
+            investigations = investigations.filter(project=project)
+        else:
+            investigations = investigations.filter(
+                project__type=PROJECT_TYPE_PROJECT
+            )
 
-        for project in projects:
-            investigation = Investigation.objects.filter(
-                project=project, active=True
-            ).first()
-            if not investigation:
-                continue
+        for investigation in investigations:
             # Only apply for investigations with the correct configuration
             if investigation.get_configuration() != self.config_name:
                 continue
             logger.debug(
                 'Updating cache for project {}..'.format(
-                    project.get_log_title()
+                    investigation.project.get_log_title()
                 )
             )
             # If a name is given, only update that specific CacheItem
@@ -140,7 +140,7 @@ def get_family_sources(study, family_id):
         item_type='SOURCE',
         characteristics__Family__value=family_id,
     )
-    if ret.count() == 0:
+    if not ret.exists():
         ret = GenericMaterial.objects.filter(
             study=study, item_type='SOURCE', name=family_id
         )
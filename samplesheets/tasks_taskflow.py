@@ -25,14 +25,18 @@ class SetIrodsCollStatusTask(SODARBaseTask):
         # Update data
         if self.execute_data['irods_status'] != irods_status:
             self.investigation.irods_status = irods_status
-            self.investigation.save()
+            self.investigation.save(
+                update_fields=['irods_status', 'date_modified']
+            )
             self.data_modified = True
         super().execute(*args, **kwargs)
 
     def revert(self, irods_status, *args, **kwargs):
         if self.data_modified is True:
             self.investigation.irods_status = self.execute_data['irods_status']
-            self.investigation.save()
+            self.investigation.save(
+                update_fields=['irods_status', 'date_modified']
+            )
 
 
 class RemoveSampleSheetsTask(SODARBaseTask):
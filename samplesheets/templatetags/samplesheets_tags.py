@@ -37,11 +37,27 @@ register = template.Library()
 # General ----------------------------------------------------------------------
 
 
-@register.simple_tag
-def get_investigation(project):
-    """Return active Investigation for a project"""
+@register.simple_tag(takes_context=True)
+def get_investigation(context, project):
+    """
+    Return active Investigation for a project. If the view has already provided
+    the active investigation in the template context, it is returned without
+    querying.
+    """
+    investigation = context.get('investigation')
+    if (
+        isinstance(investigation, Investigation)
+        and investigation.active
+        and investigation.project_id == project.pk
+    ):
+        return investigation
     try:
-        return Investigation.objects.get(project=project, active=True)
+        # Studies and assays are listed with their projects in the details card
+        return (
+            Investigation.objects.select_related('project')
+            .prefetch_related('studies__assays')
+            .get(project=project, active=True)
+        )
     except Investigation.DoesNotExist:
         return None
 
@@ -60,21 +76,27 @@ def get_irods_tree(investigation):
     irods_backend = get_backend_api('omics_irods')
     if not irods_backend:
         return ''
-    ret = '<ul><li>{}<ul>'.format(settings.IRODS_SAMPLE_COLL)
-    for study in investigation.studies.all():
-        ret += '<li>{}'.format(
-            irods_backend.get_sub_path(study, include_parent=False)
+    ret = ['<ul><li>{}<ul>'.format(settings.IRODS_SAMPLE_COLL)]
+    # Fetch assays for all studies in a single query
+    for study in investigation.studies.all().prefetch_related('assays'):
+        ret.append(
+            '<li>{}'.format(
+                irods_backend.get_sub_path(study, include_parent=False)
+            )
         )
-        if study.assays.count() > 0:
-            ret += '<ul>'
-            for assay in study.assays.all():
-                ret += '<li>{}</li>'.format(
-                    irods_backend.get_sub_path(assay, include_parent=False)
+        assays = study.assays.all()
+        if assays:
+            ret.append('<ul>')
+            for assay in assays:
+                ret.append(
+                    '<li>{}</li>'.format(
+                        irods_backend.get_sub_path(assay, include_parent=False)
+                    )
                 )
-            ret += '</ul>'
-        ret += '</li>'
-    ret += '</ul></li></ul>'
-    return ret
+            ret.append('</ul>')
+        ret.append('</li>')
+    ret.append('</ul></li></ul>')
+    return ''.join(ret)
 
 
 @register.simple_tag
@@ -129,13 +151,12 @@ def get_isatab_tag_html(isatab):
     """
     if not isatab.tags:
         return '<span class="text-muted">N/A</span>'
-    ret = ''
-    for tag in sorted(isatab.tags):
-        ret += '<span class="badge badge-pill badge-{}">' '{}</span>\n'.format(
-            TAG_COLORS[tag] if tag in TAG_COLORS else DEFAULT_TAG_COLOR,
-            tag.capitalize(),
+    return ''.join(
+        '<span class="badge badge-pill badge-{}">{}</span>\n'.format(
+            TAG_COLORS.get(tag, DEFAULT_TAG_COLOR), tag.capitalize()
         )
-    return ret
+        for tag in sorted(isatab.tags)
+    )
 
 
 @register.simple_tag
@@ -150,9 +171,7 @@ def get_request_path_html(irods_request):
 @register.simple_tag
 def get_request_status_class(irods_request):
     """Return IrodsDataRequest status classes"""
-    if irods_request.status not in REQUEST_STATUS_CLASSES:
-        return ''
-    return REQUEST_STATUS_CLASSES[irods_request.status]
+    return REQUEST_STATUS_CLASSES.get(irods_request.status, '')
 
 
 @register.filter
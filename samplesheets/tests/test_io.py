@@ -4,6 +4,7 @@ import csv
 import io
 import os
 import warnings
+from unittest import mock
 from zipfile import ZipFile
 
 from altamisa.isatab import (
@@ -23,7 +24,7 @@ from projectroles.tests.test_models import (
     RoleAssignmentMixin,
 )
 
-from samplesheets.models import Investigation, ISATab
+from samplesheets.models import Investigation, ISATab, GenericMaterial, Process
 from samplesheets.io import SampleSheetIO
 
 
@@ -452,6 +453,21 @@ class TestSampleSheetIOImport(SampleSheetIOTestBase):
         out_data = self.sheet_io._import_publications(in_data)
         self.assertEqual(len(out_data), len(in_data))
 
+    def test_import_isa_batch_size(self):
+        """Test import_isa() with materials and processes in multiple batches"""
+        investigation = self.import_isa_from_file(SHEET_PATH, self.project)
+        material_count = GenericMaterial.objects.count()
+        process_count = Process.objects.count()
+        self.assertGreater(material_count, 2)
+        self.assertGreater(process_count, 2)
+        investigation.delete()
+        self.assertEqual(GenericMaterial.objects.count(), 0)
+
+        with mock.patch('samplesheets.io.IMPORT_BATCH_SIZE', 2):
+            self.import_isa_from_file(SHEET_PATH, self.project)
+        self.assertEqual(GenericMaterial.objects.count(), material_count)
+        self.assertEqual(Process.objects.count(), process_count)
+
 
 class TestSampleSheetIOExport(SampleSheetIOTestBase):
     """Sample sheet export tests"""
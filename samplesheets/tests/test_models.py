@@ -18,7 +18,7 @@ from django.utils import timezone
 from test_plus.test import TestCase
 
 # Projectroles dependency
-from projectroles.models import SODAR_CONSTANTS
+from projectroles.models import Role, ROLE_RANKING, SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
 from projectroles.tests.test_models import (
     ProjectMixin,
@@ -439,6 +439,42 @@ class IrodsDataRequestMixin:
 # Test classes -----------------------------------------------------------------
 
 
+class RoleFixtureMixin:
+    """Helper mixin for initializing roles in setUpTestData()"""
+
+    @classmethod
+    def init_roles_class(cls):
+        """
+        Initialize SODAR Core roles as class attributes. Equal to
+        RoleMixin.init_roles(), but usable as a classmethod and done in two
+        queries.
+        """
+        role_finder = SODAR_CONSTANTS['PROJECT_ROLE_FINDER']
+        Role.objects.bulk_create(
+            [
+                Role(name=n, rank=r)
+                for n, r in ROLE_RANKING.items()
+                if n != role_finder
+            ]
+            + [
+                Role(
+                    name=role_finder,
+                    rank=ROLE_RANKING[role_finder],
+                    project_types=[SODAR_CONSTANTS['PROJECT_TYPE_CATEGORY']],
+                )
+            ],
+            ignore_conflicts=True,
+        )
+        roles = Role.objects.in_bulk(ROLE_RANKING.keys(), field_name='name')
+        cls.role_owner = roles[SODAR_CONSTANTS['PROJECT_ROLE_OWNER']]
+        cls.role_delegate = roles[SODAR_CONSTANTS['PROJECT_ROLE_DELEGATE']]
+        cls.role_contributor = roles[
+            SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR']
+        ]
+        cls.role_guest = roles[SODAR_CONSTANTS['PROJECT_ROLE_GUEST']]
+        cls.role_finder = roles[role_finder]
+
+
 class SamplesheetsModelTestBase(
     ProjectMixin,
     RoleMixin,
@@ -541,6 +577,42 @@ class TestInvestigation(SamplesheetsModelTestBase):
         """Test Investigation get_project() function"""
         self.assertEqual(self.investigation.get_project(), self.project)
 
+    def test_get_material_counts(self):
+        """Test Investigation get_material_counts() function"""
+        self.assertEqual(self.investigation.get_material_counts(), {})
+        self.make_material(
+            item_type='SOURCE',
+            name=SOURCE_NAME,
+            unique_name=SOURCE_UNIQUE_NAME,
+            characteristics=SOURCE_CHARACTERISTICS,
+            study=self.study,
+            assay=None,
+            material_type=None,
+            extra_material_type=None,
+            factor_values=None,
+            comments=DEFAULT_COMMENTS,
+        )
+        self.make_material(
+            item_type='DATA',
+            name=DATA_NAME,
+            unique_name=DATA_UNIQUE_NAME,
+            characteristics={},
+            study=None,
+            assay=self.assay,
+            material_type=DATA_TYPE,
+            extra_material_type=None,
+            factor_values=None,
+            comments=DEFAULT_COMMENTS,
+        )
+        with self.assertNumQueries(1):
+            counts = self.investigation.get_material_counts()
+        self.assertEqual(counts, {'SOURCE': 1, 'DATA': 1})
+        for item_type in ['SOURCE', 'MATERIAL', 'SAMPLE', 'DATA']:
+            self.assertEqual(
+                counts.get(item_type, 0),
+                self.investigation.get_material_count(item_type),
+            )
+
     def test_get_url(self):
         """Test get_url()"""
         expected = reverse(
@@ -613,6 +685,31 @@ class TestStudy(SamplesheetsModelTestBase):
         ) + '#/study/{}'.format(self.study.sodar_uuid)
         self.assertEqual(self.study.get_url(), expected)
 
+    def test_get_graph_nodes(self):
+        """Test get_graph_nodes()"""
+        self.assertEqual(self.study.get_graph_nodes(), [])
+        self.make_material(
+            item_type='SOURCE',
+            name=SOURCE_NAME,
+            unique_name=SOURCE_UNIQUE_NAME,
+            characteristics=SOURCE_CHARACTERISTICS,
+            study=self.study,
+            assay=None,
+            material_type=None,
+            extra_material_type=None,
+            factor_values=None,
+            extract_label={},
+            comments=DEFAULT_COMMENTS,
+        )
+        nodes = self.study.get_graph_nodes()
+        self.assertEqual(len(nodes), 1)
+        self.assertEqual(nodes[0].unique_name, SOURCE_UNIQUE_NAME)
+        self.assertEqual(nodes[0].item_type, 'SOURCE')
+        self.assertEqual(
+            [n.unique_name for n in nodes],
+            [n.unique_name for n in self.study.get_nodes()],
+        )
+
 
 class TestProtocol(SamplesheetsModelTestBase):
     """Tests for the Protocol model"""
@@ -718,10 +815,51 @@ class TestAssay(SamplesheetsModelTestBase):
         """Test Assay get_project() function"""
         self.assertEqual(self.assay.get_project(), self.project)
 
+    def test_get_project_cache(self):
+        """Test Assay get_project() caching and clearing on save"""
+        self.assay = Assay.objects.get(pk=self.assay.pk)
+        self.assertEqual(self.assay.get_project(), self.project)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.assay.get_project(), self.project)
+            self.assertEqual(self.assay.get_study(), self.study)
+        new_project = self.make_project(
+            'NewProject', SODAR_CONSTANTS['PROJECT_TYPE_PROJECT'], None
+        )
+        new_investigation = self.make_investigation(
+            identifier=INV_IDENTIFIER,
+            file_name=INV_FILE_NAME,
+            project=new_project,
+            title=INV_TITLE,
+            description=DEFAULT_DESCRIPTION,
+            comments=DEFAULT_COMMENTS,
+        )
+        new_study = self.make_study(
+            identifier=STUDY_IDENTIFIER,
+            file_name=STUDY_FILE_NAME,
+            investigation=new_investigation,
+            title=STUDY_TITLE,
+            description=DEFAULT_DESCRIPTION,
+            comments=DEFAULT_COMMENTS,
+        )
+        self.assay.study = new_study
+        self.assay.save()
+        self.assertEqual(self.assay.get_project(), new_project)
+        self.assertEqual(self.assay.get_study(), new_study)
+
     def test_get_name(self):
         """Test Assay get_name() function"""
         self.assertEqual(self.assay.get_name(), 'assay')
 
+    def test_get_name_dots(self):
+        """Test Assay get_name() with dots in file name"""
+        self.assay.file_name = 'a_assay.v1.txt'
+        self.assertEqual(self.assay.get_name(), 'assayv1')
+
+    def test_get_name_no_extension(self):
+        """Test Assay get_name() with no file extension"""
+        self.assay.file_name = 'a_assay'
+        self.assertEqual(self.assay.get_name(), '')
+
     def test_get_plugin(self):
         """Test get_plugin() with measurement/technology type"""
         self.assay.measurement_type = {
@@ -932,6 +1070,15 @@ class TestSample(SamplesheetsModelTestBase):
         """Test SAMPLE GenericMaterial get_parent() function"""
         self.assertEqual(self.material.get_parent(), self.study)
 
+    def test_get_sample_assays(self):
+        """Test SAMPLE GenericMaterial get_sample_assays() function"""
+        self.assertEqual(list(self.material.get_sample_assays()), [])
+        self.assay.arcs = [[SAMPLE_UNIQUE_NAME, 'p1']]
+        self.assay.save()
+        assays = list(self.material.get_sample_assays())
+        self.assertEqual(assays, [self.assay])
+        self.assertIn('arcs', assays[0].get_deferred_fields())
+
 
 class TestMaterial(SamplesheetsModelTestBase):
     """Tests for the GenericMaterial model with type MATERIAL"""
@@ -1010,6 +1157,13 @@ class TestMaterial(SamplesheetsModelTestBase):
         """Test MATERIAL GenericMaterial get_parent() function"""
         self.assertEqual(self.material.get_parent(), self.assay)
 
+    def test_validate_parent(self):
+        """Test MATERIAL GenericMaterial parent validation on save()"""
+        self.material.study = None
+        self.material.assay = None
+        with self.assertRaises(ValidationError):
+            self.material.save()
+
 
 class TestDataFile(SamplesheetsModelTestBase):
     """Tests for the GenericMaterial model with type DATA"""
@@ -1296,6 +1450,13 @@ class TestProcess(SamplesheetsModelTestBase):
         """Test Process get_parent() function"""
         self.assertEqual(self.process.get_parent(), self.assay)
 
+    def test_validate_parent(self):
+        """Test Process parent validation on save()"""
+        self.process.study = None
+        self.process.assay = None
+        with self.assertRaises(ValidationError):
+            self.process.save()
+
     # TODO: Test header helpers
 
 
@@ -1390,6 +1551,21 @@ class TestISATab(SamplesheetsModelTestBase):
         )
         self.assertEqual(self.isatab.get_full_name(), expected)
 
+    def test_get_name_annotated(self):
+        """Test get_name() with annotated investigation title"""
+        isatab = ISATab.objects.with_investigation_title().get(
+            sodar_uuid=self.isatab.sodar_uuid
+        )
+        self.assertEqual(isatab.investigation_title, self.investigation.title)
+        expected = '{} ({})'.format(
+            self.investigation.title,
+            timezone.localtime(self.isatab.date_created).strftime(
+                '%Y-%m-%d %H:%M:%S'
+            ),
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(isatab.get_full_name(), expected)
+
 
 class TestIrodsAccessTicket(IrodsAccessTicketMixin, SamplesheetsModelTestBase):
     """Tests for the IrodsAccessTicket model"""
@@ -1471,6 +1647,17 @@ class TestIrodsAccessTicket(IrodsAccessTicketMixin, SamplesheetsModelTestBase):
         )
         self.assertEqual(self.ticket.get_display_name(), expected)
 
+    def test_get_display_name_assay_count(self):
+        """Test get_display_name() with annotated assay count"""
+        self.ticket.project_assay_count = 2
+        expected = '{} / {} / {}'.format(
+            self.ticket.assay.get_display_name(),
+            self.ticket.get_coll_name(),
+            self.ticket.get_label(),
+        )
+        with self.assertNumQueries(0):
+            self.assertEqual(self.ticket.get_display_name(), expected)
+
     def test_get_webdav_link(self):
         """Test get_webdav_link()"""
         m = re.search(r'^(https?://)', settings.IRODS_WEBDAV_URL_ANON)
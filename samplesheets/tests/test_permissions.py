@@ -1,12 +1,14 @@
 """Tests for UI view permissions in the samplesheets app"""
 
+from contextlib import contextmanager
 from urllib.parse import urlencode
 
-from django.test import override_settings
+from django.test import modify_settings, override_settings
 from django.urls import reverse
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
+from projectroles.models import RoleAssignment, SODAR_CONSTANTS
 from projectroles.tests.test_permissions import TestProjectPermissionBase
 from projectroles.utils import build_secret
 
@@ -19,12 +21,22 @@ from samplesheets.tests.test_io import SampleSheetIOMixin, SHEET_DIR
 from samplesheets.tests.test_models import (
     IrodsAccessTicketMixin,
     IrodsDataRequestMixin,
+    RoleFixtureMixin,
 )
 
 
 app_settings = AppSettingAPI()
 
 
+# SODAR constants
+PROJECT_TYPE_CATEGORY = SODAR_CONSTANTS['PROJECT_TYPE_CATEGORY']
+PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
+PROJECT_ROLE_OWNER = SODAR_CONSTANTS['PROJECT_ROLE_OWNER']
+PROJECT_ROLE_DELEGATE = SODAR_CONSTANTS['PROJECT_ROLE_DELEGATE']
+PROJECT_ROLE_CONTRIBUTOR = SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR']
+PROJECT_ROLE_GUEST = SODAR_CONSTANTS['PROJECT_ROLE_GUEST']
+PROJECT_ROLE_FINDER = SODAR_CONSTANTS['PROJECT_ROLE_FINDER']
+
 # Local constants
 APP_NAME = 'samplesheets'
 SHEET_PATH = SHEET_DIR + 'i_small.zip'
@@ -34,28 +46,124 @@ REMOTE_SITE_SECRET = build_secret()
 INVALID_SECRET = build_secret()
 IRODS_TICKET_PATH = '/sodarZone/ticket/path'
 IRODS_FILE_PATH = '/sodarZone/path/test1.txt'
+AUTH_BACKEND = 'django.contrib.auth.backends.ModelBackend'
 
 
+# NOTE: Drop middleware not affecting view permissions to speed up requests
+@modify_settings(
+    MIDDLEWARE={
+        'remove': [
+            'django.middleware.security.SecurityMiddleware',
+            'django.middleware.csrf.CsrfViewMiddleware',
+            'django.middleware.clickjacking.XFrameOptionsMiddleware',
+            'django_cprofile_middleware.middleware.ProfilerMiddleware',
+            'projectroles.middleware.ProfilerMiddleware',
+        ]
+    }
+)
 class SamplesheetsPermissionTestBase(
-    SampleSheetIOMixin, TestProjectPermissionBase
+    RoleFixtureMixin, SampleSheetIOMixin, TestProjectPermissionBase
 ):
     """Base test class for samplesheets UI view permissions"""
 
+    @classmethod
+    def setUpTestData(cls):
+        # NOTE: Same fixtures as in TestProjectPermissionBase.setUp(), created
+        #       once per class as all changes are rolled back after each test
+        # Init roles
+        cls.init_roles_class()
+        # Init users
+        # Superuser
+        cls.superuser = cls.make_user('superuser')
+        cls.superuser.is_staff = True
+        cls.superuser.is_superuser = True
+        cls.superuser.save()
+        # No user
+        cls.anonymous = None
+        # Users with role assignments
+        cls.user_owner_cat = cls.make_user('user_owner_cat')
+        cls.user_delegate_cat = cls.make_user('user_delegate_cat')
+        cls.user_contributor_cat = cls.make_user('user_contributor_cat')
+        cls.user_guest_cat = cls.make_user('user_guest_cat')
+        cls.user_finder_cat = cls.make_user('user_finder_cat')
+        cls.user_owner = cls.make_user('user_owner')
+        cls.user_delegate = cls.make_user('user_delegate')
+        cls.user_contributor = cls.make_user('user_contributor')
+        cls.user_guest = cls.make_user('user_guest')
+        # User without role assignments
+        cls.user_no_roles = cls.make_user('user_no_roles')
+        # Init projects
+        cls.category = cls.make_project(
+            title='TestCategory', type=PROJECT_TYPE_CATEGORY, parent=None
+        )
+        cls.project = cls.make_project(
+            title='TestProject', type=PROJECT_TYPE_PROJECT, parent=cls.category
+        )
+        # Init role assignments
+        # NOTE: Created in bulk, skipping RoleAssignment.save() validation
+        (
+            cls.owner_as_cat,
+            cls.delegate_as_cat,
+            cls.contributor_as_cat,
+            cls.guest_as_cat,
+            cls.finder_as_cat,
+            cls.owner_as,
+            cls.delegate_as,
+            cls.contributor_as,
+            cls.guest_as,
+        ) = RoleAssignment.objects.bulk_create(
+            [
+                RoleAssignment(project=project, user=user, role=role)
+                for project, user, role in [
+                    (cls.category, cls.user_owner_cat, cls.role_owner),
+                    (cls.category, cls.user_delegate_cat, cls.role_delegate),
+                    (
+                        cls.category,
+                        cls.user_contributor_cat,
+                        cls.role_contributor,
+                    ),
+                    (cls.category, cls.user_guest_cat, cls.role_guest),
+                    (cls.category, cls.user_finder_cat, cls.role_finder),
+                    (cls.project, cls.user_owner, cls.role_owner),
+                    (cls.project, cls.user_delegate, cls.role_delegate),
+                    (cls.project, cls.user_contributor, cls.role_contributor),
+                    (cls.project, cls.user_guest, cls.role_guest),
+                ]
+            ]
+        )
+        # Import investigation
+        cls.investigation = cls.import_isa_from_file(SHEET_PATH, cls.project)
+        cls.study = cls.investigation.studies.first()
+        cls.assay = cls.study.assays.first()
+
     def setUp(self):
-        super().setUp()
-        self.investigation = self.import_isa_from_file(SHEET_PATH, self.project)
-        self.study = self.investigation.studies.first()
-        self.assay = self.study.assays.first()
+        # NOTE: Skip TestProjectPermissionBase.setUp(), see setUpTestData()
+        pass
+
+    @contextmanager
+    def login(self, user):
+        """
+        Log in user for the duration of the context. Skips authentication as
+        only permissions are tested here.
+
+        :param user: SODARUser object
+        """
+        self.client.force_login(user, backend=AUTH_BACKEND)
+        try:
+            yield
+        finally:
+            self.client.logout()
 
 
 class TestProjectSheetsView(SamplesheetsPermissionTestBase):
     """Permission tests for ProjectSheetsView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:project_sheets',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -115,10 +223,11 @@ class TestProjectSheetsView(SamplesheetsPermissionTestBase):
 class TestSheetImportView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetImportView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
-            'samplesheets:import', kwargs={'project': self.project.sodar_uuid}
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
+            'samplesheets:import', kwargs={'project': cls.project.sodar_uuid}
         )
 
     def test_get(self):
@@ -223,11 +332,12 @@ class TestSheetImportView(SamplesheetsPermissionTestBase):
 class TestSheetTemplateSelectView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetTemplateSelectView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:template_select',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -399,13 +509,14 @@ class TestSheetTemplateCreateView(TestProjectPermissionBase):
 class TestSheetExcelExportView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetExcelExportView"""
 
-    def setUp(self):
-        super().setUp()
-        self.study_url = reverse(
-            'samplesheets:export_excel', kwargs={'study': self.study.sodar_uuid}
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.study_url = reverse(
+            'samplesheets:export_excel', kwargs={'study': cls.study.sodar_uuid}
         )
-        self.assay_url = reverse(
-            'samplesheets:export_excel', kwargs={'assay': self.assay.sodar_uuid}
+        cls.assay_url = reverse(
+            'samplesheets:export_excel', kwargs={'assay': cls.assay.sodar_uuid}
         )
 
     def test_get_study(self):
@@ -514,11 +625,12 @@ class TestSheetExcelExportView(SamplesheetsPermissionTestBase):
 class TestSheetISAExportView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetISAExportView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:export_isa',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -576,10 +688,11 @@ class TestSheetISAExportView(SamplesheetsPermissionTestBase):
 class TestSheetDeleteView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetDeleteView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
-            'samplesheets:delete', kwargs={'project': self.project.sodar_uuid}
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
+            'samplesheets:delete', kwargs={'project': cls.project.sodar_uuid}
         )
 
     def test_get(self):
@@ -637,10 +750,11 @@ class TestSheetDeleteView(SamplesheetsPermissionTestBase):
 class TestSheetVersionListView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionListView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
-            'samplesheets:versions', kwargs={'project': self.project.sodar_uuid}
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
+            'samplesheets:versions', kwargs={'project': cls.project.sodar_uuid}
         )
 
     def test_get(self):
@@ -698,16 +812,17 @@ class TestSheetVersionListView(SamplesheetsPermissionTestBase):
 class TestSheetVersionCompareView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionCompareView"""
 
-    def setUp(self):
-        super().setUp()
-        self.isa_version = ISATab.objects.first()
-        self.url = '{}?source={}&target={}'.format(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.isa_version = ISATab.objects.first()
+        cls.url = '{}?source={}&target={}'.format(
             reverse(
                 'samplesheets:version_compare',
-                kwargs={'project': self.project.sodar_uuid},
+                kwargs={'project': cls.project.sodar_uuid},
             ),
-            str(self.isa_version.sodar_uuid),
-            str(self.isa_version.sodar_uuid),
+            str(cls.isa_version.sodar_uuid),
+            str(cls.isa_version.sodar_uuid),
         )
 
     def test_get(self):
@@ -765,16 +880,17 @@ class TestSheetVersionCompareView(SamplesheetsPermissionTestBase):
 class TestSheetVersionCompareFileView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionCompareFileView"""
 
-    def setUp(self):
-        super().setUp()
-        self.isa_version = ISATab.objects.first()
-        self.url = '{}?source={}&target={}&filename={}&category={}'.format(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.isa_version = ISATab.objects.first()
+        cls.url = '{}?source={}&target={}&filename={}&category={}'.format(
             reverse(
                 'samplesheets:version_compare_file',
-                kwargs={'project': self.project.sodar_uuid},
+                kwargs={'project': cls.project.sodar_uuid},
             ),
-            str(self.isa_version.sodar_uuid),
-            str(self.isa_version.sodar_uuid),
+            str(cls.isa_version.sodar_uuid),
+            str(cls.isa_version.sodar_uuid),
             's_small.txt',
             'studies',
         )
@@ -834,14 +950,15 @@ class TestSheetVersionCompareFileView(SamplesheetsPermissionTestBase):
 class TestSheetVersionRestoreView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionRestoreView"""
 
-    def setUp(self):
-        super().setUp()
-        self.isa_version = ISATab.objects.get(
-            investigation_uuid=self.investigation.sodar_uuid
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.isa_version = ISATab.objects.get(
+            investigation_uuid=cls.investigation.sodar_uuid
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:version_restore',
-            kwargs={'isatab': self.isa_version.sodar_uuid},
+            kwargs={'isatab': cls.isa_version.sodar_uuid},
         )
 
     def test_get(self):
@@ -899,14 +1016,15 @@ class TestSheetVersionRestoreView(SamplesheetsPermissionTestBase):
 class TestSheetVersionUpdateView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionUpdateView"""
 
-    def setUp(self):
-        super().setUp()
-        self.isa_version = ISATab.objects.get(
-            investigation_uuid=self.investigation.sodar_uuid
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.isa_version = ISATab.objects.get(
+            investigation_uuid=cls.investigation.sodar_uuid
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:version_update',
-            kwargs={'isatab': self.isa_version.sodar_uuid},
+            kwargs={'isatab': cls.isa_version.sodar_uuid},
         )
 
     def test_get(self):
@@ -964,14 +1082,15 @@ class TestSheetVersionUpdateView(SamplesheetsPermissionTestBase):
 class TestSheetVersionDeleteView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionDeleteView"""
 
-    def setUp(self):
-        super().setUp()
-        self.isa_version = ISATab.objects.get(
-            investigation_uuid=self.investigation.sodar_uuid
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.isa_version = ISATab.objects.get(
+            investigation_uuid=cls.investigation.sodar_uuid
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:version_delete',
-            kwargs={'isatab': self.isa_version.sodar_uuid},
+            kwargs={'isatab': cls.isa_version.sodar_uuid},
         )
 
     def test_get(self):
@@ -1029,18 +1148,19 @@ class TestSheetVersionDeleteView(SamplesheetsPermissionTestBase):
 class TestSheetVersionDeleteBatchView(SamplesheetsPermissionTestBase):
     """Permission tests for SheetVersionDeleteBatchView"""
 
-    def setUp(self):
-        super().setUp()
-        self.isa_version = ISATab.objects.get(
-            investigation_uuid=self.investigation.sodar_uuid
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.isa_version = ISATab.objects.get(
+            investigation_uuid=cls.investigation.sodar_uuid
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:version_delete_batch',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
-        self.post_data = {
+        cls.post_data = {
             'confirm': '1',
-            'version_check': str(self.isa_version.sodar_uuid),
+            'version_check': str(cls.isa_version.sodar_uuid),
         }
 
     def test_post(self):
@@ -1112,11 +1232,12 @@ class TestSheetVersionDeleteBatchView(SamplesheetsPermissionTestBase):
 class TestIrodsAccessTicketListView(SamplesheetsPermissionTestBase):
     """Permission tests for IrodsAccessTicketListView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:irods_tickets',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -1176,11 +1297,12 @@ class TestIrodsAccessTicketListView(SamplesheetsPermissionTestBase):
 class TestIrodsAccessTicketCreateView(SamplesheetsPermissionTestBase):
     """Permission tests for IrodsAccessTicketCreateView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:irods_ticket_create',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -1243,17 +1365,18 @@ class TestIrodsAccessTicketUpdateView(
 ):
     """Permission tests for IrodsAccessTicketUpdateView"""
 
-    def setUp(self):
-        super().setUp()
-        self.ticket = self.make_irods_ticket(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.ticket = cls.make_irods_ticket(
             path=IRODS_TICKET_PATH,
-            study=self.study,
-            assay=self.assay,
-            user=self.user_owner,
+            study=cls.study,
+            assay=cls.assay,
+            user=cls.user_owner,
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:irods_ticket_update',
-            kwargs={'irodsaccessticket': self.ticket.sodar_uuid},
+            kwargs={'irodsaccessticket': cls.ticket.sodar_uuid},
         )
 
     def test_get(self):
@@ -1315,17 +1438,18 @@ class TestIrodsAccessTicketDeleteView(
 ):
     """Permission tests for IrodsAccessTicketDeleteView"""
 
-    def setUp(self):
-        super().setUp()
-        self.ticket = self.make_irods_ticket(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.ticket = cls.make_irods_ticket(
             path=IRODS_TICKET_PATH,
-            study=self.study,
-            assay=self.assay,
-            user=self.user_owner,
+            study=cls.study,
+            assay=cls.assay,
+            user=cls.user_owner,
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:irods_ticket_delete',
-            kwargs={'irodsaccessticket': self.ticket.sodar_uuid},
+            kwargs={'irodsaccessticket': cls.ticket.sodar_uuid},
         )
 
     def test_get(self):
@@ -1385,11 +1509,12 @@ class TestIrodsAccessTicketDeleteView(
 class TestIrodsDataRequestListView(SamplesheetsPermissionTestBase):
     """Permission tests for IrodsDataRequestListView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:irods_requests',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -1447,11 +1572,12 @@ class TestIrodsDataRequestListView(SamplesheetsPermissionTestBase):
 class TestIrodsDataRequestCreateView(SamplesheetsPermissionTestBase):
     """Permission tests for IrodsDataRequestCreateView"""
 
-    def setUp(self):
-        super().setUp()
-        self.url = reverse(
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.url = reverse(
             'samplesheets:irods_request_create',
-            kwargs={'project': self.project.sodar_uuid},
+            kwargs={'project': cls.project.sodar_uuid},
         )
 
     def test_get(self):
@@ -1511,18 +1637,19 @@ class TestIrodsDataRequestUpdateView(
 ):
     """Permission tests for IrodsDataRequestUpdateView"""
 
-    def setUp(self):
-        super().setUp()
-        self.request = self.make_irods_request(
-            project=self.project,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.request = cls.make_irods_request(
+            project=cls.project,
             action=IRODS_REQUEST_ACTION_DELETE,
             path=IRODS_FILE_PATH,
             status=IRODS_REQUEST_STATUS_ACTIVE,
-            user=self.user_contributor,
+            user=cls.user_contributor,
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:irods_request_update',
-            kwargs={'irodsdatarequest': self.request.sodar_uuid},
+            kwargs={'irodsdatarequest': cls.request.sodar_uuid},
         )
 
     def test_get(self):
@@ -1582,18 +1709,19 @@ class TestIrodsDataRequestAcceptView(
 ):
     """Permission tests for IrodsDataRequestAcceptView"""
 
-    def setUp(self):
-        super().setUp()
-        self.request = self.make_irods_request(
-            project=self.project,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.request = cls.make_irods_request(
+            project=cls.project,
             action=IRODS_REQUEST_ACTION_DELETE,
             path=IRODS_FILE_PATH,
             status=IRODS_REQUEST_STATUS_ACTIVE,
-            user=self.user_contributor,
+            user=cls.user_contributor,
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:irods_request_accept',
-            kwargs={'irodsdatarequest': self.request.sodar_uuid},
+            kwargs={'irodsdatarequest': cls.request.sodar_uuid},
         )
 
     def test_get(self):
@@ -1657,18 +1785,19 @@ class TestIrodsDataRequestDeleteView(
 ):
     """Permission tests for TestIrodsDataRequestDeleteAPIView"""
 
-    def setUp(self):
-        super().setUp()
-        self.request = self.make_irods_request(
-            project=self.project,
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.request = cls.make_irods_request(
+            project=cls.project,
             action=IRODS_REQUEST_ACTION_DELETE,
             path=IRODS_FILE_PATH,
             status=IRODS_REQUEST_STATUS_ACTIVE,
-            user=self.user_contributor,
+            user=cls.user_contributor,
         )
-        self.url = reverse(
+        cls.url = reverse(
             'samplesheets:irods_request_delete',
-            kwargs={'irodsdatarequest': self.request.sodar_uuid},
+            kwargs={'irodsdatarequest': cls.request.sodar_uuid},
         )
 
     def test_get(self):
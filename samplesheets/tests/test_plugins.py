@@ -3,11 +3,16 @@
 # NOTE: These are generic tests for common plugin methods and helpers,
 # study/assay plugin specific tests should go in their own modules
 
+from copy import deepcopy
+
+from django.conf import settings
+from django.test import override_settings
+
 from test_plus.test import TestCase
 
 # Projectroles dependency
 from projectroles.models import SODAR_CONSTANTS
-from projectroles.plugins import get_backend_api
+from projectroles.plugins import ProjectAppPluginPoint, get_backend_api
 from projectroles.tests.test_models import (
     ProjectMixin,
     RoleMixin,
@@ -19,17 +24,33 @@ from samplesheets.plugins import get_irods_content
 from samplesheets.assayapps.dna_sequencing.plugins import (
     SampleSheetAssayPlugin as DnaSequencingPlugin,
 )
+from samplesheets.assayapps.generic.plugins import (
+    SampleSheetAssayPlugin as GenericPlugin,
+    RESULTS_COMMENT,
+    MISC_FILES_COMMENT,
+    DATA_COMMENT_PREFIX,
+    DATA_LINK_COMMENT,
+)
 from samplesheets.rendering import SampleSheetTableBuilder
 from samplesheets.tests.test_io import (
     SampleSheetIOMixin,
     SHEET_DIR,
 )
+from samplesheets.utils import get_top_headers
+from samplesheets.views import MISC_FILES_COLL, RESULTS_COLL
 
 
 # Local constants
 SHEET_PATH = SHEET_DIR + 'i_minimal2.zip'
 MATERIAL_NAME = '0815-N1-DNA1'
 ASSAY_PLUGIN_NAME = 'samplesheets.assayapps.dna_sequencing'
+# Column indices in the SHEET_PATH assay table
+NAME_COLS = [4, 6, 10, 11]  # Linkable material and data file names
+PROTOCOL_COLS = [1, 3, 5, 8]
+ASSAY_NAME_COL = 9
+ASSAY_NAME = '0815-N1-DNA1-WES1'
+ROW_PATH = '/sodarZone/row/path'
+LINK_VALUE = 'Link <https://example.com>'
 
 
 class SamplesheetsPluginTestBase(
@@ -131,3 +152,217 @@ class TestUpdateCacheRows(SamplesheetsPluginTestBase):
             self.plugin.update_cache_rows(
                 ASSAY_PLUGIN_NAME, project=self.project
             )
+
+
+class TestGetObjectLink(SamplesheetsPluginTestBase):
+    """Tests for ProjectAppPlugin.get_object_link()"""
+
+    def setUp(self):
+        super().setUp()
+        self.plugin = ProjectAppPluginPoint.get_plugin('samplesheets')
+
+    def test_get_object_link_investigation(self):
+        """Test get_object_link() with investigation"""
+        ret = self.plugin.get_object_link(
+            'Investigation', self.investigation.sodar_uuid
+        )
+        self.assertEqual(ret['url'], self.investigation.get_url())
+        self.assertEqual(ret['label'], self.investigation.title)
+
+    def test_get_object_link_assay(self):
+        """Test get_object_link() with assay"""
+        ret = self.plugin.get_object_link('Assay', self.assay.sodar_uuid)
+        self.assertEqual(ret['url'], self.assay.get_url())
+        self.assertEqual(ret['label'], self.assay.get_display_name())
+
+    def test_get_object_link_invalid_model(self):
+        """Test get_object_link() with unsupported model string"""
+        self.assertIsNone(
+            self.plugin.get_object_link('Project', self.project.sodar_uuid)
+        )
+
+
+class TestGenericAssayPlugin(SamplesheetsPluginTestBase):
+    """Tests for the generic assay plugin"""
+
+    def _get_table(self, irods_path=ROW_PATH):
+        """Return assay table with iRODS row paths set"""
+        table = self.tb.build_study_tables(self.study)['assays'][
+            str(self.assay.sodar_uuid)
+        ]
+        table['irods_paths'] = [
+            {'path': irods_path} if irods_path else None
+            for _ in table['table_data']
+        ]
+        return table
+
+    def setUp(self):
+        super().setUp()
+        self.plugin = GenericPlugin()
+        self.assay_path = self.plugin.get_assay_path(self.assay)
+        self.base_url = settings.IRODS_WEBDAV_URL + self.assay_path
+        self.results_url = f'{self.base_url}/{RESULTS_COLL}'
+        self.misc_url = f'{self.base_url}/{MISC_FILES_COLL}'
+        self.data_url = settings.IRODS_WEBDAV_URL + ROW_PATH
+
+    def test_get_table_context(self):
+        """Test get_table_context()"""
+        self.assay.comments = {
+            RESULTS_COMMENT: 'Assay Name',
+            MISC_FILES_COMMENT: 'Label',
+            DATA_LINK_COMMENT: 'Protocol',
+            DATA_COMMENT_PREFIX + ' 1': 'Assay Name',
+        }
+        table = self._get_table()
+        table_ctx = self.plugin.get_table_context(table, self.assay)
+        self.assertEqual(table_ctx.assay_ctx.assay_path, self.assay_path)
+        self.assertEqual(table_ctx.assay_ctx.results_cols, ['assay name'])
+        self.assertEqual(table_ctx.assay_ctx.misc_cols, ['label'])
+        self.assertEqual(table_ctx.assay_ctx.data_cols, ['protocol'])
+        self.assertEqual(table_ctx.assay_ctx.data_columns, ['Assay Name'])
+        self.assertEqual(table_ctx.header_index['assay name'], ASSAY_NAME_COL)
+        # Duplicate headers point to the last column
+        self.assertEqual(table_ctx.header_index['protocol'], PROTOCOL_COLS[-1])
+        self.assertEqual(
+            [c[0] for c in table_ctx.link_cols],
+            sorted(NAME_COLS + PROTOCOL_COLS + [7, ASSAY_NAME_COL]),
+        )
+
+    def test_get_table_context_no_comments(self):
+        """Test get_table_context() with no link comments"""
+        table = self._get_table()
+        table_ctx = self.plugin.get_table_context(table, self.assay)
+        self.assertIsNone(table_ctx.assay_ctx.results_cols)
+        self.assertIsNone(table_ctx.assay_ctx.misc_cols)
+        self.assertIsNone(table_ctx.assay_ctx.data_cols)
+        self.assertEqual(table_ctx.assay_ctx.data_columns, [])
+        # Material names can always be linked
+        self.assertEqual([c[0] for c in table_ctx.link_cols], NAME_COLS)
+
+    def test_get_table_context_default(self):
+        """Test get_table_context() default implementation"""
+        table = self._get_table()
+        self.assertEqual(
+            DnaSequencingPlugin().get_table_context(table, self.assay),
+            get_top_headers(table),
+        )
+
+    def test_update_row_no_comments(self):
+        """Test update_row() with no link comments"""
+        table = self._get_table()
+        row = table['table_data'][0]
+        expected = deepcopy(row)
+        self.plugin.update_row(row, table, self.assay, 0)
+        self.assertEqual(row, expected)
+
+    @override_settings(IRODS_WEBDAV_ENABLED=False)
+    def test_update_row_webdav_disabled(self):
+        """Test update_row() with WebDAV disabled"""
+        self.assay.comments = {RESULTS_COMMENT: 'Assay Name'}
+        table = self._get_table()
+        row = table['table_data'][0]
+        expected = deepcopy(row)
+        self.plugin.update_row(row, table, self.assay, 0)
+        self.assertEqual(row, expected)
+
+    def test_update_row_results(self):
+        """Test update_row() with Results links"""
+        self.assay.comments = {RESULTS_COMMENT: 'Assay Name'}
+        table = self._get_table()
+        row = table['table_data'][0]
+        self.plugin.update_row(row, table, self.assay, 0)
+        self.assertEqual(
+            row[ASSAY_NAME_COL]['value'],
+            f'{ASSAY_NAME} <{self.results_url}/{ASSAY_NAME}>',
+        )
+        for i in PROTOCOL_COLS:
+            self.assertNotIn('<', row[i]['value'])
+
+    def test_update_row_misc_files(self):
+        """Test update_row() with MiscFiles links"""
+        self.assay.comments = {MISC_FILES_COMMENT: 'Protocol'}
+        table = self._get_table()
+        row = table['table_data'][0]
+        values = [c['value'] for c in row]
+        self.plugin.update_row(row, table, self.assay, 0)
+        for i in PROTOCOL_COLS:
+            self.assertEqual(
+                row[i]['value'],
+                f'{values[i]} <{self.misc_url}/{values[i]}>',
+            )
+        self.assertEqual(row[ASSAY_NAME_COL]['value'], ASSAY_NAME)
+
+    def test_update_row_row_links(self):
+        """Test update_row() with Row links"""
+        self.assay.comments = {DATA_LINK_COMMENT: 'Assay Name'}
+        table = self._get_table()
+        row = table['table_data'][0]
+        self.plugin.update_row(row, table, self.assay, 0)
+        self.assertEqual(
+            row[ASSAY_NAME_COL]['value'],
+            f'{ASSAY_NAME} <{self.data_url}/{ASSAY_NAME}>',
+        )
+
+    def test_update_row_row_links_path(self):
+        """Test update_row() with Row links and row path from comments"""
+        self.assay.comments = {
+            RESULTS_COMMENT: 'Protocol',
+            DATA_LINK_COMMENT: 'Assay Name',
+            DATA_COMMENT_PREFIX + ' 1': 'Protocol',
+        }
+        table = self._get_table(irods_path=None)
+        row = table['table_data'][0]
+        protocol = row[PROTOCOL_COLS[-1]]['value']
+        self.plugin.update_row(row, table, self.assay, 0)
+        # Row path must be read from values not yet modified by Results links
+        row_url = (
+            f'{settings.IRODS_WEBDAV_URL}{self.assay_path}/{protocol}'
+            f'/{ASSAY_NAME}'
+        )
+        self.assertEqual(
+            row[ASSAY_NAME_COL]['value'], f'{ASSAY_NAME} <{row_url}>'
+        )
+
+    def test_update_row_material_names(self):
+        """Test update_row() with material Name columns"""
+        self.assay.comments = {RESULTS_COMMENT: 'Assay Name'}
+        table = self._get_table()
+        row = table['table_data'][0]
+        values = [c['value'] for c in row]
+        self.plugin.update_row(row, table, self.assay, 0)
+        for i in NAME_COLS:
+            self.assertEqual(row[i]['value'], values[i])
+            self.assertEqual(row[i]['link'], f'{self.results_url}/{values[i]}')
+
+    def test_update_row_existing_link(self):
+        """Test update_row() with cells already containing a link"""
+        self.assay.comments = {
+            RESULTS_COMMENT: 'Assay Name',
+            DATA_LINK_COMMENT: 'Assay Name',
+        }
+        table = self._get_table()
+        row = table['table_data'][0]
+        row[ASSAY_NAME_COL]['value'] = LINK_VALUE
+        row[0]['value'] = LINK_VALUE
+        self.plugin.update_row(row, table, self.assay, 0)
+        self.assertEqual(row[ASSAY_NAME_COL]['value'], LINK_VALUE)
+        self.assertEqual(row[0]['value'], LINK_VALUE)
+        self.assertNotIn('link', row[0])
+
+    def test_update_row_table_ctx(self):
+        """Test update_row() with and without table_ctx"""
+        self.assay.comments = {
+            RESULTS_COMMENT: 'Assay Name',
+            MISC_FILES_COMMENT: 'Label',
+            DATA_LINK_COMMENT: 'Protocol',
+        }
+        table = self._get_table()
+        table_ctx = self.plugin.get_table_context(table, self.assay)
+        row = deepcopy(table['table_data'][0])
+        row_ctx = deepcopy(row)
+        self.plugin.update_row(row, table, self.assay, 0)
+        self.plugin.update_row(
+            row_ctx, table, self.assay, 0, table_ctx=table_ctx
+        )
+        self.assertEqual(row_ctx, row)
+        self.assertNotEqual(row_ctx, table['table_data'][0])
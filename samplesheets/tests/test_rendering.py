@@ -1,5 +1,8 @@
 """Tests for samplesheets.rendering"""
 
+from copy import deepcopy
+
+from django.core.cache import cache
 from django.test import override_settings
 from test_plus.test import TestCase
 
@@ -7,22 +10,23 @@ from test_plus.test import TestCase
 from projectroles.app_settings import AppSettingAPI
 from projectroles.models import SODAR_CONSTANTS
 from projectroles.plugins import get_backend_api
-from projectroles.tests.test_models import (
-    ProjectMixin,
-    RoleMixin,
-    RoleAssignmentMixin,
-)
+from projectroles.tests.test_models import ProjectMixin, RoleAssignmentMixin
 
 from samplesheets.models import GenericMaterial
 from samplesheets.rendering import (
     SampleSheetTableBuilder,
     STUDY_TABLE_CACHE_ITEM,
+    STUDY_TABLE_MEM_CACHE_KEY,
+    STUDY_TABLE_MEM_CACHE_VERSION_KEY,
+    get_list_header,
+    get_text_length,
 )
 from samplesheets.tests.test_io import (
     SampleSheetIOMixin,
     SHEET_DIR,
     SHEET_DIR_SPECIAL,
 )
+from samplesheets.tests.test_models import RoleFixtureMixin
 from samplesheets.tests.test_sheet_config import SheetConfigMixin
 
 
@@ -38,25 +42,35 @@ SHEET_PATH_ALT = SHEET_DIR + 'i_small2.zip'
 
 # TODO: Unify with TestTableBuilder if no other classes are needed
 class SamplesheetsRenderingTestBase(
-    ProjectMixin, RoleMixin, RoleAssignmentMixin, SampleSheetIOMixin, TestCase
+    ProjectMixin,
+    RoleFixtureMixin,
+    RoleAssignmentMixin,
+    SampleSheetIOMixin,
+    TestCase,
 ):
     """Base class for samplesheets rendering tests"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
+        # NOTE: Shared by all tests in the class, modifications are rolled back
         # Init roles
-        self.init_roles()
+        cls.init_roles_class()
         # Make owner user
-        self.user_owner = self.make_user('owner')
+        cls.user_owner = cls.make_user('owner')
         # Init project and assignment
-        self.project = self.make_project(
+        cls.project = cls.make_project(
             'TestProject', SODAR_CONSTANTS['PROJECT_TYPE_PROJECT'], None
         )
-        self.owner_as = self.make_assignment(
-            self.project, self.user_owner, self.role_owner
+        cls.owner_as = cls.make_assignment(
+            cls.project,
+            cls.user_owner,
+            cls.role_owner,
         )
         # Import investigation
-        self.investigation = self.import_isa_from_file(SHEET_PATH, self.project)
-        self.study = self.investigation.studies.first()
+        cls.investigation = cls.import_isa_from_file(SHEET_PATH, cls.project)
+        cls.study = cls.investigation.studies.first()
+
+    def setUp(self):
         self.tb = SampleSheetTableBuilder()
         # Set up helpers
         self.cache_backend = get_backend_api('sodar_cache')
@@ -64,6 +78,22 @@ class SamplesheetsRenderingTestBase(
             study=self.study.sodar_uuid
         )
         self.cache_args = [APP_NAME, self.cache_name, self.project]
+        cache.clear()
+
+    def _get_mem_cache(self):
+        """Return study tables from memory cache for current version"""
+        version = cache.get(
+            STUDY_TABLE_MEM_CACHE_VERSION_KEY.format(
+                study=self.study.sodar_uuid
+            )
+        )
+        if not version:
+            return None
+        return cache.get(
+            STUDY_TABLE_MEM_CACHE_KEY.format(
+                study=self.study.sodar_uuid, version=version
+            )
+        )
 
 
 class TestTableBuilder(SheetConfigMixin, SamplesheetsRenderingTestBase):
@@ -104,6 +134,15 @@ class TestTableBuilder(SheetConfigMixin, SamplesheetsRenderingTestBase):
         self.assertIsNotNone(h2)
         self.assertNotEqual(h1, h2)
 
+    def test_build_study_reference(self):
+        """Test build_study_reference()"""
+        study_arcs = list(self.study.arcs)
+        all_refs = self.tb.build_study_reference(self.study)
+        self.assertGreater(len(all_refs), 0)
+        self.assertTrue(all('-source-' in r[0] for r in all_refs))
+        # Study arcs should not be modified
+        self.assertEqual(self.study.arcs, study_arcs)
+
     def test_build_study_tables(self):
         """Test build_study_tables()"""
         tables = self.tb.build_study_tables(self.study)
@@ -250,6 +289,30 @@ class TestTableBuilder(SheetConfigMixin, SamplesheetsRenderingTestBase):
         val_field = tables['study']['table_data'][2]
         self.assertEqual(val_field[2]['value'], '90')
 
+    @override_settings(SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT=60)
+    def test_get_study_tables_mem_cache(self):
+        """Test get_study_tables() with memory cache"""
+        self.assertIsNone(self._get_mem_cache())
+        study_tables = self.tb.get_study_tables(self.study)
+        self.assertEqual(self._get_mem_cache(), study_tables)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.tb.get_study_tables(self.study), study_tables)
+
+    @override_settings(SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT=60)
+    def test_get_study_tables_mem_cache_from_item(self):
+        """Test get_study_tables() with memory cache and existing cache item"""
+        study_tables = self.tb.build_study_tables(self.study)
+        self.cache_backend.set_cache_item(
+            APP_NAME, self.cache_name, study_tables, 'json', self.project
+        )
+        self.assertEqual(self.tb.get_study_tables(self.study), study_tables)
+        self.assertEqual(self._get_mem_cache(), study_tables)
+
+    def test_get_study_tables_mem_cache_disabled(self):
+        """Test get_study_tables() with memory cache disabled"""
+        self.tb.get_study_tables(self.study)
+        self.assertIsNone(self._get_mem_cache())
+
     def test_clear_study_cache(self):
         """Test clear_study_cache()"""
         study_tables = self.tb.build_study_tables(self.study)
@@ -264,6 +327,36 @@ class TestTableBuilder(SheetConfigMixin, SamplesheetsRenderingTestBase):
         cache_item = self.cache_backend.get_cache_item(*self.cache_args)
         self.assertEqual(cache_item.data, {})
 
+    @override_settings(SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT=60)
+    def test_clear_study_cache_mem_cache(self):
+        """Test clear_study_cache() with memory cache"""
+        self.tb.get_study_tables(self.study)
+        self.assertIsNotNone(self._get_mem_cache())
+        self.tb.clear_study_cache(self.study)
+        self.assertIsNone(self._get_mem_cache())
+
+    @override_settings(
+        CACHES={
+            'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'samplesheets-test-rendering',
+            }
+        },
+        SHEETS_STUDY_TABLE_MEM_CACHE_TIMEOUT=60,
+    )
+    def test_clear_study_cache_mem_cache_stale_set(self):
+        """Test clear_study_cache() with memory cache set after clearing"""
+        study_tables = self.tb.get_study_tables(self.study)
+        version = self.tb._get_mem_cache_version(self.study)
+        stale_tables = deepcopy(study_tables)
+        stale_tables['study']['table_data'] = []
+        # Simulate request setting tables read before clearing
+        self.tb.clear_study_cache(self.study)
+        self.tb.set_mem_cache(self.study, stale_tables, version)
+        self.assertIsNone(self._get_mem_cache())
+        self.assertEqual(self.tb.get_study_tables(self.study), study_tables)
+        self.assertEqual(self._get_mem_cache(), study_tables)
+
     def test_clear_study_cache_no_item(self):
         """Test clear_study_cache() without existing item"""
         self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
@@ -288,3 +381,45 @@ class TestTableBuilder(SheetConfigMixin, SamplesheetsRenderingTestBase):
         self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
         self.tb.clear_study_cache(self.study, delete=True)
         self.assertIsNone(self.cache_backend.get_cache_item(*self.cache_args))
+
+
+class TestGetListHeader(TestCase):
+    """Tests for get_list_header()"""
+
+    def test_get(self):
+        """Test get_list_header() with list header"""
+        self.assertEqual(
+            get_list_header('Characteristics[organism]'),
+            ('Characteristics', 'organism'),
+        )
+
+    def test_get_nested_brackets(self):
+        """Test get_list_header() with brackets in name"""
+        self.assertEqual(
+            get_list_header('Parameter Value[x [y]]'),
+            ('Parameter Value', 'x [y]'),
+        )
+
+    def test_get_not_list(self):
+        """Test get_list_header() with non-list header"""
+        self.assertIsNone(get_list_header('Sample Name'))
+
+
+class TestGetTextLength(TestCase):
+    """Tests for get_text_length()"""
+
+    def test_get(self):
+        """Test get_text_length() with regular characters"""
+        self.assertEqual(get_text_length('abc'), 3)
+
+    def test_get_narrow(self):
+        """Test get_text_length() with narrow characters"""
+        self.assertEqual(get_text_length('fill'), 2)
+
+    def test_get_wide(self):
+        """Test get_text_length() with wide characters"""
+        self.assertEqual(get_text_length('ABC'), 4)
+
+    def test_get_empty(self):
+        """Test get_text_length() with empty string"""
+        self.assertEqual(get_text_length(''), 0)
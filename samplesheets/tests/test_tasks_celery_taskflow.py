@@ -1,6 +1,9 @@
 """Tests for Celery tasks for the samplesheets app with taskflow enabled"""
 
+from unittest import mock
+
 from django.contrib import auth
+from django.db.models import Count
 from django.urls import reverse
 
 # Projectroles dependency
@@ -20,7 +23,7 @@ from taskflowbackend.tests.base import TaskflowViewTestBase
 # Timeline dependency
 from timeline.models import ProjectEvent
 
-from samplesheets.models import ISATab
+from samplesheets.models import GenericMaterial, ISATab
 from samplesheets.tasks_celery import (
     update_project_cache_task,
     sheet_sync_task,
@@ -38,11 +41,6 @@ User = auth.get_user_model()
 
 
 # SODAR constants
-PROJECT_ROLE_OWNER = SODAR_CONSTANTS['PROJECT_ROLE_OWNER']
-PROJECT_ROLE_DELEGATE = SODAR_CONSTANTS['PROJECT_ROLE_DELEGATE']
-PROJECT_ROLE_CONTRIBUTOR = SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR']
-PROJECT_ROLE_GUEST = SODAR_CONSTANTS['PROJECT_ROLE_GUEST']
-PROJECT_TYPE_CATEGORY = SODAR_CONSTANTS['PROJECT_TYPE_CATEGORY']
 PROJECT_TYPE_PROJECT = SODAR_CONSTANTS['PROJECT_TYPE_PROJECT']
 
 # Local constants
@@ -161,31 +159,30 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
         super().setUp()
         self.p_id_source = 'p{}'.format(self.project_source.pk)
         self.p_id_target = 'p{}'.format(self.project_target.pk)
+        self.source_material_name = f'{self.p_id_source}-s0-source-0817'
+        self.target_material_name = f'{self.p_id_target}-s0-source-0817'
+
+    def _get_material(self, project, unique_name):
+        """Return material from project with a single query"""
+        return GenericMaterial.objects.get(
+            study__investigation__project=project, unique_name=unique_name
+        )
+
+    def _get_sheet_counts(self, project):
+        """Return investigation, study and assay counts for project"""
+        return project.investigations.aggregate(
+            inv_count=Count('pk', distinct=True),
+            study_count=Count('studies', distinct=True),
+            assay_count=Count('studies__assays', distinct=True),
+        )
 
     def test_sync_task(self):
         """Test sync"""
         sheet_sync_task()
 
-        self.assertEqual(self.project_source.investigations.count(), 1)
-        self.assertEqual(
-            self.project_source.investigations.first().studies.count(), 1
-        )
-        self.assertEqual(
-            self.project_source.investigations.first()
-            .studies.first()
-            .assays.count(),
-            1,
-        )
-        self.assertEqual(self.project_target.investigations.count(), 1)
-        self.assertEqual(
-            self.project_target.investigations.first().studies.count(), 1
-        )
-        self.assertEqual(
-            self.project_target.investigations.first()
-            .studies.first()
-            .assays.count(),
-            1,
-        )
+        expected = {'inv_count': 1, 'study_count': 1, 'assay_count': 1}
+        self.assertEqual(self._get_sheet_counts(self.project_source), expected)
+        self.assertEqual(self._get_sheet_counts(self.project_target), expected)
         self.assertEqual(ISATab.objects.count(), 2)
 
         data_target = ISATab.objects.get(
@@ -202,7 +199,7 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
         self.import_isa_from_file(SHEET_PATH, self.project_target)
         # Update source investigation
         material = self.inv_source.studies.first().materials.get(
-            unique_name=f'{self.p_id_source}-s0-source-0817'
+            unique_name=self.source_material_name
         )
         material.characteristics['age']['value'] = '200'
         material.save()
@@ -213,17 +210,15 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
         self.assertEqual(self.project_target.investigations.count(), 1)
         self.assertEqual(ISATab.objects.count(), 2)
         self.assertEqual(
-            self.project_source.investigations.first()
-            .studies.first()
-            .materials.get(unique_name=f'{self.p_id_source}-s0-source-0817')
-            .characteristics['age']['value'],
+            self._get_material(
+                self.project_source, self.source_material_name
+            ).characteristics['age']['value'],
             '200',
         )
         self.assertEqual(
-            self.project_target.investigations.first()
-            .studies.first()
-            .materials.get(unique_name=f'{self.p_id_target}-s0-source-0817')
-            .characteristics['age']['value'],
+            self._get_material(
+                self.project_target, self.target_material_name
+            ).characteristics['age']['value'],
             '150',
         )
 
@@ -233,17 +228,15 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
         self.assertEqual(self.project_target.investigations.count(), 1)
         self.assertEqual(ISATab.objects.count(), 3)
         self.assertEqual(
-            self.project_source.investigations.first()
-            .studies.first()
-            .materials.get(unique_name=f'{self.p_id_source}-s0-source-0817')
-            .characteristics['age']['value'],
+            self._get_material(
+                self.project_source, self.source_material_name
+            ).characteristics['age']['value'],
             '200',
         )
         self.assertEqual(
-            self.project_target.investigations.first()
-            .studies.first()
-            .materials.get(unique_name=f'{self.p_id_target}-s0-source-0817')
-            .characteristics['age']['value'],
+            self._get_material(
+                self.project_target, self.target_material_name
+            ).characteristics['age']['value'],
             '200',
         )
 
@@ -251,7 +244,7 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
         """Test sync with existing sheet and changes in target sheet"""
         inv_target = self.import_isa_from_file(SHEET_PATH, self.project_target)
         material = inv_target.studies.first().materials.get(
-            unique_name=f'{self.p_id_target}-s0-source-0817'
+            unique_name=self.target_material_name
         )
         material.characteristics['age']['value'] = '300'
         material.save()
@@ -271,17 +264,15 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
             target_date_modified,
         )
         self.assertEqual(
-            self.project_source.investigations.first()
-            .studies.first()
-            .materials.get(unique_name=f'{self.p_id_source}-s0-source-0817')
-            .characteristics['age']['value'],
+            self._get_material(
+                self.project_source, self.source_material_name
+            ).characteristics['age']['value'],
             '150',
         )
         self.assertEqual(
-            self.project_target.investigations.first()
-            .studies.first()
-            .materials.get(unique_name=f'{self.p_id_target}-s0-source-0817')
-            .characteristics['age']['value'],
+            self._get_material(
+                self.project_target, self.target_material_name
+            ).characteristics['age']['value'],
             '300',
         )
 
@@ -304,7 +295,10 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
             '',
             project=self.project_target,
         )
-        sheet_sync_task()
+        # Sync should fail on input validation without a request to source
+        with mock.patch('samplesheets.views.requests.get') as mock_get:
+            sheet_sync_task()
+        mock_get.assert_not_called()
         self.assertEqual(self.project_target.investigations.count(), 0)
 
     def test_sync_enabled_wrong_url(self):
@@ -315,7 +309,10 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
             'https://qazxdfjajsrd.com',
             project=self.project_target,
         )
-        sheet_sync_task()
+        # Sync should fail on input validation without a request to source
+        with mock.patch('samplesheets.views.requests.get') as mock_get:
+            sheet_sync_task()
+        mock_get.assert_not_called()
         self.assertEqual(self.project_target.investigations.count(), 0)
 
     def test_sync_enabled_url_to_nonexisting_sheet(self):
@@ -341,7 +338,10 @@ class TestSheetRemoteSyncTask(SheetRemoteSyncTestBase):
             '',
             project=self.project_target,
         )
-        sheet_sync_task()
+        # Sync should fail on input validation without a request to source
+        with mock.patch('samplesheets.views.requests.get') as mock_get:
+            sheet_sync_task()
+        mock_get.assert_not_called()
         self.assertEqual(self.project_target.investigations.count(), 0)
 
     def test_sync_disabled(self):
@@ -3,6 +3,7 @@
 import os
 
 from django.conf import settings
+from django.template import Context
 from django.urls import reverse
 
 from test_plus.test import TestCase
@@ -103,13 +104,54 @@ class TestSamplesheetsTemplateTags(
     def test_get_investigation(self):
         """Test get_investigation()"""
         self.assertEqual(
-            s_tags.get_investigation(self.project), self.investigation
+            s_tags.get_investigation(Context(), self.project),
+            self.investigation,
         )
 
+    def test_get_investigation_context(self):
+        """Test get_investigation() with investigation in context"""
+        context = Context({'investigation': self.investigation})
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                s_tags.get_investigation(context, self.project),
+                self.investigation,
+            )
+
+    def test_get_investigation_context_other_project(self):
+        """Test get_investigation() with other project in context"""
+        project = self.make_project(
+            'OtherProject', SODAR_CONSTANTS['PROJECT_TYPE_PROJECT'], None
+        )
+        investigation = self.make_investigation(
+            identifier=INV_IDENTIFIER,
+            file_name=INV_FILE_NAME,
+            project=project,
+            title=INV_TITLE,
+            description=DEFAULT_DESCRIPTION,
+            comments=DEFAULT_COMMENTS,
+            archive_name=INV_ARCHIVE_NAME,
+        )
+        context = Context({'investigation': investigation})
+        self.assertEqual(
+            s_tags.get_investigation(context, self.project),
+            self.investigation,
+        )
+
+    def test_get_investigation_prefetch(self):
+        """Test get_investigation() studies and assays prefetching"""
+        investigation = s_tags.get_investigation(Context(), self.project)
+        with self.assertNumQueries(0):
+            for study in investigation.studies.all():
+                self.assertEqual(study.get_project(), self.project)
+                for assay in study.assays.all():
+                    self.assertEqual(assay.get_project(), self.project)
+
     def test_get_investigation_no_investigation(self):
         """Test get_investigation() without investigation"""
         self.investigation.delete()
-        self.assertEqual(s_tags.get_investigation(self.project), None)
+        self.assertEqual(
+            s_tags.get_investigation(Context(), self.project), None
+        )
 
     def test_get_search_item_type_material_types(self):
         """Test get_search_item_type() with material types"""
@@ -21,9 +21,12 @@ from samplesheets.models import GenericMaterial, Process
 from samplesheets.rendering import SampleSheetTableBuilder
 from samplesheets.utils import (
     get_alt_names,
+    get_config_name,
     get_sample_colls,
     get_index_by_header,
     get_last_material_name,
+    get_top_header,
+    get_top_headers,
     compare_inv_replace,
     get_webdav_url,
     get_ext_link_labels,
@@ -99,6 +102,30 @@ class TestGetAltNames(SamplesheetsUtilsTestBase):
         )
 
 
+class TestGetConfigName(SamplesheetsUtilsTestBase):
+    """Tests for get_config_name()"""
+
+    def test_get(self):
+        """Test get_config_name() with plain configuration name"""
+        self.assertEqual(get_config_name('bih_cancer'), 'bih_cancer')
+
+    def test_get_path(self):
+        """Test get_config_name() with local directory path"""
+        self.assertEqual(
+            get_config_name('/home/user/configs/bih_cancer'), 'bih_cancer'
+        )
+
+    def test_get_path_windows(self):
+        """Test get_config_name() with Windows directory path"""
+        self.assertEqual(
+            get_config_name('C:\\configs\\bih_cancer'), 'bih_cancer'
+        )
+
+    def test_get_path_trailing(self):
+        """Test get_config_name() with trailing separator"""
+        self.assertEqual(get_config_name('configs/'), '')
+
+
 class TestGetSampleColls(SamplesheetsUtilsTestBase):
     """Tests for get_sample_colls()"""
 
@@ -200,6 +227,43 @@ class TestGetIndexByHeader(SamplesheetsUtilsTestBase):
         )
 
 
+class TestGetTopHeader(SamplesheetsUtilsTestBase):
+    """Tests for get_top_header() and get_top_headers()"""
+
+    def setUp(self):
+        super().setUp()
+        tb = SampleSheetTableBuilder()
+        self.study_tables = tb.build_study_tables(self.study)
+        self.study_table = self.study_tables['study']
+        self.assay_table = self.study_tables['assays'][
+            str(self.assay.sodar_uuid)
+        ]
+
+    def test_get(self):
+        """Test get_top_header()"""
+        table = self.study_table
+        self.assertEqual(get_top_header(table, 0), table['top_header'][0])
+        i = table['top_header'][0]['colspan']
+        self.assertEqual(get_top_header(table, i - 1), table['top_header'][0])
+        self.assertEqual(get_top_header(table, i), table['top_header'][1])
+
+    def test_get_out_of_range(self):
+        """Test get_top_header() with a non-existent column"""
+        self.assertIsNone(
+            get_top_header(
+                self.study_table, len(self.study_table['field_header'])
+            )
+        )
+
+    def test_get_top_headers(self):
+        """Test get_top_headers()"""
+        for table in [self.study_table, self.assay_table]:
+            top_headers = get_top_headers(table)
+            self.assertEqual(len(top_headers), len(table['field_header']))
+            for i, top_header in enumerate(top_headers):
+                self.assertEqual(top_header, get_top_header(table, i))
+
+
 class TestGetLastMaterialName(SamplesheetsUtilsTestBase):
     """Tests for get_last_material_name()"""
 
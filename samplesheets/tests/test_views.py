@@ -9,7 +9,9 @@ from zipfile import ZipFile
 
 from django.conf import settings
 from django.contrib.messages import get_messages
+from django.db import connection
 from django.test import LiveServerTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils.timezone import localtime
 
@@ -68,6 +70,7 @@ from samplesheets.tests.test_io import (
 from samplesheets.tests.test_models import (
     SampleSheetModelMixin,
     IrodsDataRequestMixin,
+    RoleFixtureMixin,
 )
 from samplesheets.tests.test_sheet_config import CONFIG_PATH_DEFAULT
 
@@ -146,41 +149,47 @@ BACKEND_PLUGINS_NO_TPL.remove('isatemplates_backend')
 
 
 class SamplesheetsViewTestBase(
-    ProjectMixin, RoleMixin, RoleAssignmentMixin, SampleSheetIOMixin, TestCase
+    ProjectMixin,
+    RoleFixtureMixin,
+    RoleAssignmentMixin,
+    SampleSheetIOMixin,
+    TestCase,
 ):
     """Base view for samplesheets views tests"""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
+        # NOTE: Shared by all tests in the class, modifications are rolled back
         # Init roles
-        self.init_roles()
+        cls.init_roles_class()
         # Init users
-        self.user = self.make_user('superuser')
-        self.user.is_staff = True
-        self.user.is_superuser = True
-        self.user.save()
-        self.user_owner = self.make_user('owner')
-        self.user_delegate = self.make_user('delegate')
-        self.user_contributor = self.make_user('contributor')
-        self.user_guest = self.make_user('guest')
-        self.user_no_roles = self.make_user('user_no_roles')
+        cls.user = cls.make_user('superuser')
+        cls.user.is_staff = True
+        cls.user.is_superuser = True
+        cls.user.save()
+        cls.user_owner = cls.make_user('owner')
+        cls.user_delegate = cls.make_user('delegate')
+        cls.user_contributor = cls.make_user('contributor')
+        cls.user_guest = cls.make_user('guest')
+        cls.user_no_roles = cls.make_user('user_no_roles')
         # Init projects
-        self.category = self.make_project(
+        cls.category = cls.make_project(
             'TestCategory', PROJECT_TYPE_CATEGORY, None
         )
-        self.project = self.make_project(
-            'TestProject', PROJECT_TYPE_PROJECT, self.category
+        cls.project = cls.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, cls.category
         )
-        self.owner_as = self.make_assignment(
-            self.project, self.user_owner, self.role_owner
+        cls.owner_as = cls.make_assignment(
+            cls.project, cls.user_owner, cls.role_owner
         )
-        self.delegate_as = self.make_assignment(
-            self.project, self.user_delegate, self.role_delegate
+        cls.delegate_as = cls.make_assignment(
+            cls.project, cls.user_delegate, cls.role_delegate
         )
-        self.contributor_as = self.make_assignment(
-            self.project, self.user_contributor, self.role_contributor
+        cls.contributor_as = cls.make_assignment(
+            cls.project, cls.user_contributor, cls.role_contributor
         )
-        self.guest_as = self.make_assignment(
-            self.project, self.user_guest, self.role_guest
+        cls.guest_as = cls.make_assignment(
+            cls.project, cls.user_guest, cls.role_guest
         )
 
 
@@ -1213,7 +1222,7 @@ class TestSheetDeleteView(SamplesheetsViewTestBase):
         self.assertEqual(JSONCacheItem.objects.count(), 0)
 
 
-class TestSheetVersionListView(SamplesheetsViewTestBase):
+class TestSheetVersionListView(SampleSheetModelMixin, SamplesheetsViewTestBase):
     """Tests for the sample sheet version list view"""
 
     def test_render(self):
@@ -1240,6 +1249,37 @@ class TestSheetVersionListView(SamplesheetsViewTestBase):
             .order_by('-date_created')
             .first(),
         )
+        self.assertIn(
+            'data', response.context['object_list'][0].get_deferred_fields()
+        )
+
+    def test_render_query_count(self):
+        """Test query count of version list view with multiple versions"""
+        self.investigation = self.import_isa_from_file(SHEET_PATH, self.project)
+        url = reverse(
+            'samplesheets:versions', kwargs={'project': self.project.sodar_uuid}
+        )
+        isatab = ISATab.objects.get(project=self.project)
+        with self.login(self.user):
+            # Warm up caches so both measured requests are equally warm
+            self.client.get(url)
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get(url)
+            self.assertEqual(response.context['object_list'].count(), 1)
+            for i in range(2):
+                self.make_isatab(
+                    project=self.project,
+                    data=isatab.data,
+                    investigation_uuid=isatab.investigation_uuid,
+                    archive_name=isatab.archive_name,
+                    tags=['EDIT'],
+                    parser_version=isatab.parser_version,
+                    user=self.user_contributor,
+                )
+            # Query count should not depend on the number of versions
+            with self.assertNumQueries(len(ctx.captured_queries)):
+                response = self.client.get(url)
+        self.assertEqual(response.context['object_list'].count(), 3)
 
     def test_render_no_sheets(self):
         """Test rendering version list view with no versions available"""
@@ -19,8 +19,16 @@ from projectroles.plugins import get_backend_api
 from samplesheets.constants import DEFAULT_EXTERNAL_LINK_LABELS
 
 
+# Regex for non-alphanumeric characters stripped in get_alt_names()
+alt_name_re = re.compile(r'[^a-zA-Z0-9]')
+# Regex for the last path component in get_config_name()
+config_name_re = re.compile(r'[^/\\]*$')
+
+
 # Local constants
-ALT_NAMES_COUNT = 3  # Needed for ArrayField hack
+ALT_NAMES_COUNT = 3  # Number of alternative names returned by get_alt_names()
+BOOL_STRINGS_FALSE = frozenset(['0', 'f', 'false', 'n', 'no'])
+BOOL_STRINGS_TRUE = frozenset(['1', 't', 'true', 'y', 'yes'])
 CONFIG_LABEL_CREATE = 'Created With Configuration'
 CONFIG_LABEL_OPEN = 'Last Opened With Configuration'
 NAME_FIELDS = ['name', 'protocol']
@@ -34,7 +42,7 @@ def get_alt_names(name):
     :return: List
     """
     name = name.lower()  # Convert all versions lowercase for indexed search
-    return [name.replace('_', '-'), re.sub(r'[^a-zA-Z0-9]', '', name), name]
+    return [name.replace('_', '-'), alt_name_re.sub('', name), name]
 
 
 def get_sample_colls(investigation):
@@ -253,9 +261,7 @@ def get_config_name(config):
     :param config_val: Original configuration name (string)
     :return: String
     """
-    if config.find('/') == -1 and config.find('\\') == -1:
-        return config
-    return re.split('[/\\\\]', config)[-1]
+    return config_name_re.search(config).group(0)
 
 
 def write_excel_table(table, output, display_name):
@@ -313,6 +319,20 @@ def get_top_header(table, field_idx):
             return th
 
 
+def get_top_headers(table):
+    """
+    Return list of top headers by field header index. Use this instead of
+    get_top_header() when processing all columns of a table.
+
+    :param table: Rendered table (dict)
+    :return: List of dicts
+    """
+    top_headers = []
+    for th in table['top_header']:
+        top_headers += [th] * th['colspan']
+    return top_headers
+
+
 def clean_sheet_dir_name(name):
     """
     Clean up / sanitize sample sheet directory name.
@@ -389,8 +409,9 @@ def get_bool(bool_string):
     """
     if not isinstance(bool_string, str):
         raise ValueError('Value is not a string')
-    if bool_string.strip().lower() in ['1', 't', 'true', 'y', 'yes']:
+    value = bool_string.strip().lower()
+    if value in BOOL_STRINGS_TRUE:
         return True
-    if bool_string.strip().lower() in ['0', 'f', 'false', 'n', 'no']:
+    if value in BOOL_STRINGS_FALSE:
         return False
     raise ValueError('Unable to parse value: {}'.format(bool_string))
@@ -16,6 +16,7 @@ from urllib.parse import urljoin
 
 from django.conf import settings
 from django.contrib import messages
+from django.db.models import Value
 from django.db.models.functions import Now
 from django.http import HttpResponse
 from django.shortcuts import redirect
@@ -103,6 +104,7 @@ table_builder = SampleSheetTableBuilder()
 
 # SODAR constants
 PROJECT_ROLE_DELEGATE = SODAR_CONSTANTS['PROJECT_ROLE_DELEGATE']
+PROJECT_ROLE_CONTRIBUTOR = SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR']
 SITE_MODE_TARGET = SODAR_CONSTANTS['SITE_MODE_TARGET']
 REMOTE_LEVEL_READ_ROLES = SODAR_CONSTANTS['REMOTE_LEVEL_READ_ROLES']
 
@@ -280,7 +282,7 @@ class SheetImportMixin:
                 Investigation.objects.filter(project=project).exclude(
                     pk=old_inv.pk
                 ).delete()
-                ISATab.objects.filter(project=project).order_by(
+                ISATab.objects.filter(project=project).defer('data').order_by(
                     '-pk'
                 ).first().delete()
             self.handle_import_exception(ex, tl_event)
@@ -1282,7 +1284,7 @@ class ProjectSheetsView(
         }
         if 'study' in self.kwargs:
             app_context['initial_study'] = self.kwargs['study']
-        elif studies.count() > 0:
+        elif studies.exists():
             app_context['initial_study'] = str(studies.first().sodar_uuid)
         else:
             app_context['initial_study'] = None
@@ -1464,7 +1466,7 @@ class SheetTemplateCreateView(
         tpl_backend = get_backend_api('isatemplates_backend')
         if tpl_backend:
             return tpl_backend.get_template(t_name)
-        return CUBI_TPL_DICT[t_name] if t_name in CUBI_TPL_DICT else None
+        return CUBI_TPL_DICT.get(t_name)
 
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
@@ -1884,9 +1886,13 @@ class SheetVersionListView(
     paginate_by = settings.SHEETS_VERSION_PAGINATION
 
     def get_queryset(self):
-        return ISATab.objects.filter(
-            project__sodar_uuid=self.kwargs['project']
-        ).order_by('-date_created')
+        # ISA-Tab file contents are not needed for listing versions
+        return (
+            ISATab.objects.filter(project__sodar_uuid=self.kwargs['project'])
+            .select_related('user')
+            .defer('data')
+            .order_by('-date_created')
+        )
 
     def get_context_data(self, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
@@ -1897,6 +1903,7 @@ class SheetVersionListView(
                     project=self.get_project(),
                     investigation_uuid=context['investigation'].sodar_uuid,
                 )
+                .only('pk')
                 .order_by('-date_created')
                 .first()
             )
@@ -1969,9 +1976,11 @@ class SheetVersionRestoreView(
         investigation = context['investigation']
         if not investigation:
             return context
-        context['sheet_version'] = ISATab.objects.filter(
-            sodar_uuid=self.kwargs['isatab']
-        ).first()
+        context['sheet_version'] = (
+            ISATab.objects.filter(sodar_uuid=self.kwargs['isatab'])
+            .defer('data')
+            .first()
+        )
         return context
 
     def post(self, request, **kwargs):
@@ -2107,9 +2116,11 @@ class SheetVersionDeleteView(
         investigation = context['investigation']
         if not investigation:
             return context
-        context['sheet_version'] = ISATab.objects.filter(
-            sodar_uuid=self.kwargs['isatab']
-        ).first()
+        context['sheet_version'] = (
+            ISATab.objects.filter(sodar_uuid=self.kwargs['isatab'])
+            .defer('data')
+            .first()
+        )
         return context
 
     def get_success_url(self):
@@ -2156,8 +2167,10 @@ class SheetVersionDeleteBatchView(
 
     def get_context_data(self, request, *args, **kwargs):
         context = super().get_context_data(*args, **kwargs)
-        context['sheet_versions'] = ISATab.objects.filter(
-            sodar_uuid__in=request.POST.getlist('version_check')
+        context['sheet_versions'] = (
+            ISATab.objects.with_investigation_title()
+            .filter(sodar_uuid__in=request.POST.getlist('version_check'))
+            .defer('data')
         )
         return context
 
@@ -2214,6 +2227,18 @@ class IrodsAccessTicketListView(
     template_name = 'samplesheets/irods_access_tickets.html'
     paginate_by = settings.SHEETS_IRODS_TICKET_PAGINATION
 
+    def get_queryset(self):
+        # Provide related objects and assay count for ticket display names
+        assay_count = Assay.objects.filter(
+            study__investigation__project=self.get_project()
+        ).count()
+        return (
+            super()
+            .get_queryset()
+            .select_related('study__investigation__project', 'assay', 'user')
+            .annotate(project_assay_count=Value(assay_count))
+        )
+
 
 class IrodsAccessTicketCreateView(
     LoginRequiredMixin,
@@ -2386,12 +2411,11 @@ class IrodsDataRequestListView(
             if settings.IRODS_WEBDAV_ENABLED:
                 for item in context_data['object_list']:
                     self.get_item_extra_data(irods_session, item)
-        assign = RoleAssignment.objects.filter(
+        context_data['is_contributor'] = RoleAssignment.objects.filter(
             project=self.get_project(),
             user=self.request.user,
-            role__name=SODAR_CONSTANTS['PROJECT_ROLE_CONTRIBUTOR'],
-        )
-        context_data['is_contributor'] = bool(assign)
+            role__name=PROJECT_ROLE_CONTRIBUTOR,
+        ).exists()
         context_data['irods_webdav_enabled'] = settings.IRODS_WEBDAV_ENABLED
         return context_data
 
@@ -253,9 +253,7 @@ class EditConfigMixin:
             logger.error('Role "{}" not found'.format(min_role_set))
             return False
         if project.is_owner(user):  # Local or inherited owner
-            user_role = Role.objects.filter(
-                name=SODAR_CONSTANTS['PROJECT_ROLE_OWNER']
-            ).first()
+            user_role = Role.objects.filter(name=PROJECT_ROLE_OWNER).first()
         else:
             role_as = project.get_role(user)
             if not role_as:
@@ -503,6 +501,7 @@ class SheetContextAjaxView(EditConfigMixin, SODARBaseProjectAjaxView):
         }
 
         # Statistics
+        material_counts = inv.get_material_counts() if inv else {}
         ret_data['sheet_stats'] = (
             {
                 'study_count': Study.objects.filter(investigation=inv).count(),
@@ -515,10 +514,10 @@ class SheetContextAjaxView(EditConfigMixin, SODARBaseProjectAjaxView):
                 'process_count': Process.objects.filter(
                     protocol__study__investigation=inv
                 ).count(),
-                'source_count': inv.get_material_count('SOURCE'),
-                'material_count': inv.get_material_count('MATERIAL'),
-                'sample_count': inv.get_material_count('SAMPLE'),
-                'data_count': inv.get_material_count('DATA'),
+                'source_count': material_counts.get('SOURCE', 0),
+                'material_count': material_counts.get('MATERIAL', 0),
+                'sample_count': material_counts.get('SAMPLE', 0),
+                'data_count': material_counts.get('DATA', 0),
             }
             if inv
             else {}
@@ -1518,9 +1517,7 @@ class SheetRowDeleteAjaxView(BaseSheetEditAjaxView):
         )
 
         # Build reference table
-        ref_study = Study.objects.get(sodar_uuid=row['study'])  # See issue #902
-        study_nodes = ref_study.get_nodes()
-        all_refs = table_builder.build_study_reference(ref_study, study_nodes)
+        all_refs = table_builder.build_study_reference(study)
         sample_idx = table_builder.get_sample_idx(all_refs)
         arc_del_count = 0
 
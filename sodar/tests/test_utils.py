@@ -0,0 +1,29 @@
+"""Tests for shared utility functions in SODAR"""
+
+import time
+import uuid
+
+from test_plus.test import TestCase
+
+from sodar.utils import get_uuid7
+
+
+# Local constants
+UUID_VARIANT = uuid.RFC_4122
+
+
+class TestGetUUID7(TestCase):
+    """Tests for get_uuid7()"""
+
+    def test_get_uuid7(self):
+        """Test get_uuid7() version and variant"""
+        sodar_uuid = get_uuid7()
+        self.assertEqual(sodar_uuid.version, 7)
+        self.assertEqual(sodar_uuid.variant, UUID_VARIANT)
+
+    def test_get_uuid7_ordering(self):
+        """Test get_uuid7() timestamp ordering"""
+        uuid1 = get_uuid7()
+        time.sleep(0.002)
+        uuid2 = get_uuid7()
+        self.assertLess(uuid1, uuid2)
@@ -20,9 +20,7 @@ class MyUserCreationForm(UserCreationForm):
 
     def clean_username(self):
         username = self.cleaned_data["username"]
-        try:
-            User.objects.get(username=username)
-        except User.DoesNotExist:
+        if not User.objects.filter(username=username).exists():
             return username
         raise forms.ValidationError(self.error_messages['duplicate_username'])
 
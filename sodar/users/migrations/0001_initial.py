@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.11 on 2018-04-11 15:58
-from __future__ import unicode_literals
 
 import django.contrib.auth.models
 import django.contrib.auth.validators
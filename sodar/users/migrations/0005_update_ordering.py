@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 # Generated by Django 1.11.29 on 2020-10-22 06:56
-from __future__ import unicode_literals
 
 from django.db import migrations
 
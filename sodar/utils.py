@@ -0,0 +1,25 @@
+"""Utilities shared by SODAR apps"""
+
+import os
+import time
+import uuid
+
+
+def get_uuid7():
+    """
+    Return a time-ordered version 7 UUID as specified in RFC 9562. Used as the
+    default for sodar_uuid fields so new keys are inserted sequentially into
+    the unique index.
+
+    :return: UUID object
+    """
+    ts_ms = time.time_ns() // 1000000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (ts_ms & 0xFFFFFFFFFFFF) << 80
+        | 0x7 << 76
+        | ((rand >> 62) & 0xFFF) << 64
+        | 0x2 << 62
+        | (rand & 0x3FFFFFFFFFFFFFFF)
+    )
+    return uuid.UUID(int=value)
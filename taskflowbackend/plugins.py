@@ -8,7 +8,12 @@ from django.contrib.auth import get_user_model
 
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
-from projectroles.models import RoleAssignment, SODAR_CONSTANTS, ROLE_RANKING
+from projectroles.models import (
+    RoleAssignment,
+    SODAR_CONSTANTS,
+    ROLE_RANKING,
+    CAT_DELIMITER,
+)
 from projectroles.plugins import (
     BackendPluginPoint,
     ProjectModifyPluginMixin,
@@ -74,11 +79,58 @@ class BackendPlugin(ProjectModifyPluginMixin, BackendPluginPoint):
         """
         if project.type != PROJECT_TYPE_CATEGORY:
             return []
-        return [
-            p
-            for p in project.get_children(flat=True)
-            if p.type == PROJECT_TYPE_PROJECT
-        ]
+        return list(
+            project.get_children(flat=True).filter(type=PROJECT_TYPE_PROJECT)
+        )
+
+    @classmethod
+    def _get_role_children(cls, children, user):
+        """
+        Return category children in which user has a local or inherited role.
+        Equivalent to calling get_role() for each child, but done with a
+        single query.
+
+        :param children: List of Project objects
+        :param user: SODARUser object
+        :return: List of Project objects
+        """
+        child_ranks = cls._get_child_ranks(children, user)
+        return [c for c in children if child_ranks[c.pk] is not None]
+
+    @classmethod
+    def _get_child_ranks(cls, children, user, exclude_as=None):
+        """
+        Return the highest local or inherited role rank of user in each of the
+        category children, optionally excluding a specific role assignment.
+        Roles not available for projects are ignored as in get_role().
+        Equivalent to querying assignments of each child and its parents, but
+        done with a single query.
+
+        :param children: List of Project objects
+        :param user: SODARUser object
+        :param exclude_as: RoleAssignment object to be excluded (optional)
+        :return: Dict of {project pk: rank or None}
+        """
+        role_as_qs = RoleAssignment.objects.filter(
+            user=user, role__project_types__contains=[PROJECT_TYPE_PROJECT]
+        )
+        if exclude_as:
+            role_as_qs = role_as_qs.exclude(sodar_uuid=exclude_as.sodar_uuid)
+        ranks = {}
+        for title, rank in role_as_qs.values_list(
+            'project__full_title', 'role__rank'
+        ):
+            ranks[title] = min(rank, ranks.get(title, rank))
+        ret = {}
+        for c in children:
+            c_ranks = [
+                r
+                for t, r in ranks.items()
+                if c.full_title == t
+                or c.full_title.startswith(t + CAT_DELIMITER)
+            ]
+            ret[c.pk] = min(c_ranks) if c_ranks else None
+        return ret
 
     # API methods --------------------------------------------------------------
 
@@ -277,13 +329,14 @@ class BackendPlugin(ProjectModifyPluginMixin, BackendPluginPoint):
             )
         elif children:  # Category children
             flow_data = {'roles_add': [], 'roles_delete': []}
+            # Finder not returned for project
+            role_children = (
+                self._get_role_children(children, user)
+                if role_as.role.rank >= RANK_FINDER
+                else children
+            )
             for c in children:
-                k = (
-                    'roles_delete'
-                    if role_as.role.rank >= RANK_FINDER
-                    and not c.get_role(user)  # Finder not returned for project
-                    else 'roles_add'
-                )
+                k = 'roles_add' if c in role_children else 'roles_delete'
                 flow_data[k].append(get_batch_role(c, user.username))
             taskflow.submit(
                 project=None,
@@ -328,19 +381,13 @@ class BackendPlugin(ProjectModifyPluginMixin, BackendPluginPoint):
             flow_data['roles_delete'].append(get_batch_role(project, user_name))
         elif project.type == PROJECT_TYPE_CATEGORY:
             children = self._get_child_projects(project)
+            # Search for inherited roles for children
+            # NOTE: role_as still exists so it has to be excluded
+            child_ranks = self._get_child_ranks(children, user, role_as)
             for c in children:
                 batch_role = get_batch_role(c, user_name)
-                # Search for inherited roles for child
-                # NOTE: role_as still exists so it has to be excluded
-                c_as = (
-                    RoleAssignment.objects.filter(
-                        user=user, project__in=[c] + list(c.get_parents())
-                    )
-                    .order_by('role__rank')
-                    .exclude(sodar_uuid=role_as.sodar_uuid)
-                    .first()
-                )
-                local_access = c_as and c_as.role.rank < RANK_FINDER
+                c_rank = child_ranks[c.pk]
+                local_access = c_rank is not None and c_rank < RANK_FINDER
                 if action == PROJECT_ACTION_CREATE and not local_access:
                     flow_data['roles_delete'].append(batch_role)
                 elif action == PROJECT_ACTION_UPDATE:
@@ -396,17 +443,11 @@ class BackendPlugin(ProjectModifyPluginMixin, BackendPluginPoint):
                 )
         else:  # Category
             children = self._get_child_projects(project)
+            # NOTE: role_as still exists so it has to be excluded
+            child_ranks = self._get_child_ranks(children, user, role_as)
             for c in children:
-                # NOTE: role_as still exists so it has to be excluded
-                c_as = (
-                    RoleAssignment.objects.filter(
-                        user=user, project__in=[c] + list(c.get_parents())
-                    )
-                    .order_by('role__rank')
-                    .exclude(sodar_uuid=role_as.sodar_uuid)
-                    .first()
-                )
-                if not c_as or c_as.role.rank >= RANK_FINDER:
+                c_rank = child_ranks[c.pk]
+                if c_rank is None or c_rank >= RANK_FINDER:
                     flow_data['roles_delete'].append(
                         get_batch_role(c, user_name)
                     )
@@ -452,21 +493,17 @@ class BackendPlugin(ProjectModifyPluginMixin, BackendPluginPoint):
                 )
         else:  # Category
             children = self._get_child_projects(project)
+            # NOTE: role_as still exists so it has to be excluded
+            child_ranks = {}
+            if role_as.role.rank >= RANK_FINDER:
+                child_ranks = self._get_child_ranks(children, user, role_as)
             for c in children:
                 batch_role = get_batch_role(c, user_name)
-                # NOTE: role_as still exists so it has to be excluded
                 if role_as.role.rank < RANK_FINDER:
                     flow_data['roles_add'].append(batch_role)
                 else:
-                    c_as = (
-                        RoleAssignment.objects.filter(
-                            user=user, project__in=[c] + list(c.get_parents())
-                        )
-                        .order_by('role__rank')
-                        .exclude(sodar_uuid=role_as.sodar_uuid)
-                        .first()
-                    )
-                    if c_as and c_as.role.rank < RANK_FINDER:
+                    c_rank = child_ranks[c.pk]
+                    if c_rank is not None and c_rank < RANK_FINDER:
                         k = 'roles_add'
                     else:
                         k = 'roles_delete'
@@ -23,6 +23,7 @@ from packaging import version
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.test import tag
 from django.urls import reverse
 
 from rest_framework.test import APILiveServerTestCase
@@ -67,6 +68,8 @@ TEST_MODE_ERR_MSG = (
 DEFAULT_PERMANENT_USERS = ['client_user', 'rods', 'rodsadmin', 'public']
 
 
+# NOTE: Tagged to exclude from parallel runs, as all tests share one iRODS zone
+@tag('taskflow')
 class TaskflowTestMixin(ProjectMixin, RoleMixin, RoleAssignmentMixin):
     """Setup/teardown methods and helpers for taskflow tests"""
 
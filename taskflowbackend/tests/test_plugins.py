@@ -5,10 +5,17 @@ from irods.exception import UserDoesNotExist, UserGroupDoesNotExist
 
 from django.test import RequestFactory
 
+from test_plus.test import TestCase
+
 # Projectroles dependency
 from projectroles.app_settings import AppSettingAPI
 from projectroles.models import RoleAssignment, SODAR_CONSTANTS
 from projectroles.plugins import BackendPluginPoint
+from projectroles.tests.test_models import (
+    ProjectMixin,
+    RoleMixin,
+    RoleAssignmentMixin,
+)
 
 # Irodsbackend dependency
 from irodsbackend.api import USER_GROUP_TEMPLATE
@@ -16,6 +23,7 @@ from irodsbackend.api import USER_GROUP_TEMPLATE
 # Timeline dependency
 from timeline.models import ProjectEvent
 
+from taskflowbackend.plugins import BackendPlugin
 from taskflowbackend.tests.base import TaskflowViewTestBase
 
 
@@ -1418,3 +1426,130 @@ class TestPerformProjectSync(ModifyAPITaskflowTestBase):
         self.assert_group_member(project, self.user, True)
         self.assert_group_member(project, self.user_owner_cat, True)
         self.assert_group_member(project, user_new, False)
+
+
+class TestGetChildRanks(ProjectMixin, RoleMixin, RoleAssignmentMixin, TestCase):
+    """Tests for _get_child_ranks() and _get_role_children() (no iRODS)"""
+
+    def setUp(self):
+        self.init_roles()
+        self.user_owner = self.make_user('user_owner')
+        self.user = self.make_user('user')
+        self.category = self.make_project(
+            'TestCategory', PROJECT_TYPE_CATEGORY, None
+        )
+        self.make_assignment(self.category, self.user_owner, self.role_owner)
+        self.sub_category = self.make_project(
+            'SubCategory', PROJECT_TYPE_CATEGORY, self.category
+        )
+        self.make_assignment(
+            self.sub_category, self.user_owner, self.role_owner
+        )
+        self.project = self.make_project(
+            'TestProject', PROJECT_TYPE_PROJECT, self.sub_category
+        )
+        self.make_assignment(self.project, self.user_owner, self.role_owner)
+        # Sibling category with a title sharing a prefix with self.category
+        self.category_sibling = self.make_project(
+            'TestCategory2', PROJECT_TYPE_CATEGORY, None
+        )
+        self.make_assignment(
+            self.category_sibling, self.user_owner, self.role_owner
+        )
+        self.project_sibling = self.make_project(
+            'TestProject2', PROJECT_TYPE_PROJECT, self.category_sibling
+        )
+        self.make_assignment(
+            self.project_sibling, self.user_owner, self.role_owner
+        )
+        self.children = [self.project, self.project_sibling]
+        # NOTE: Called on the class as taskflow may not be enabled
+        self.plugin = BackendPlugin
+
+    def test_get_child_ranks_no_roles(self):
+        """Test _get_child_ranks() with no roles for user"""
+        self.assertEqual(
+            self.plugin._get_child_ranks(self.children, self.user),
+            {self.project.pk: None, self.project_sibling.pk: None},
+        )
+
+    def test_get_child_ranks_local(self):
+        """Test _get_child_ranks() with local role"""
+        self.make_assignment(self.project, self.user, self.role_guest)
+        self.assertEqual(
+            self.plugin._get_child_ranks(self.children, self.user),
+            {
+                self.project.pk: self.role_guest.rank,
+                self.project_sibling.pk: None,
+            },
+        )
+
+    def test_get_child_ranks_nested(self):
+        """Test _get_child_ranks() with role in top category"""
+        self.make_assignment(self.category, self.user, self.role_contributor)
+        self.assertEqual(
+            self.plugin._get_child_ranks(self.children, self.user),
+            {
+                self.project.pk: self.role_contributor.rank,
+                self.project_sibling.pk: None,
+            },
+        )
+
+    def test_get_child_ranks_highest(self):
+        """Test _get_child_ranks() with multiple roles"""
+        self.make_assignment(self.category, self.user, self.role_guest)
+        self.make_assignment(
+            self.sub_category, self.user, self.role_contributor
+        )
+        self.assertEqual(
+            self.plugin._get_child_ranks(self.children, self.user),
+            {
+                self.project.pk: self.role_contributor.rank,
+                self.project_sibling.pk: None,
+            },
+        )
+
+    def test_get_child_ranks_exclude(self):
+        """Test _get_child_ranks() with excluded role assignment"""
+        self.make_assignment(self.category, self.user, self.role_guest)
+        role_as = self.make_assignment(
+            self.sub_category, self.user, self.role_contributor
+        )
+        self.assertEqual(
+            self.plugin._get_child_ranks(self.children, self.user, role_as),
+            {
+                self.project.pk: self.role_guest.rank,
+                self.project_sibling.pk: None,
+            },
+        )
+
+    def test_get_child_ranks_finder(self):
+        """Test _get_child_ranks() with finder role"""
+        self.make_assignment(self.category, self.user, self.role_finder)
+        self.assertEqual(
+            self.plugin._get_child_ranks(self.children, self.user),
+            {self.project.pk: None, self.project_sibling.pk: None},
+        )
+
+    def test_get_role_children(self):
+        """Test _get_role_children() with role in top category"""
+        self.make_assignment(self.category, self.user, self.role_guest)
+        self.assertEqual(
+            self.plugin._get_role_children(self.children, self.user),
+            [self.project],
+        )
+
+    def test_get_role_children_sibling(self):
+        """Test _get_role_children() with role in prefixed sibling category"""
+        self.make_assignment(self.category_sibling, self.user, self.role_guest)
+        self.assertEqual(
+            self.plugin._get_role_children(self.children, self.user),
+            [self.project_sibling],
+        )
+
+    def test_get_role_children_finder(self):
+        """Test _get_role_children() with finder role"""
+        self.make_assignment(self.category, self.user, self.role_finder)
+        self.assertEqual(
+            self.plugin._get_role_children(self.children, self.user), []
+        )